@@ -22,6 +22,7 @@ import sys
 import os
 import time
 import signal
+import asyncio
 import argparse
 from datetime import datetime
 
@@ -34,25 +35,24 @@ if sys.platform == "win32":
     except Exception:
         pass
 
-from rich.console import Console
-from rich.live import Live
-from rich.text import Text
-from rich.panel import Panel
-from rich import box
-
-import config
-from candle_feed import CandleFeed
-from trade_manager import TradeManager
-from market_finder import MarketFinder
-from strategy import StrategyEngine
-from dashboard import Dashboard
-
+# Heavy imports (rich, requests, dotenv, py_clob_client transitives) are
+# deferred into the functions that need them so `python bot.py --status`
+# starts fast.
 
 # ── Globals ─────────────────────────────────────────
-console = Console()
+console = None  # Created lazily by _get_console()
 running = True
 
 
+def _get_console():
+    """Create the shared Rich console on first use."""
+    global console
+    if console is None:
+        from rich.console import Console
+        console = Console()
+    return console
+
+
 def signal_handler(sig, frame):
     """Handle Ctrl+C gracefully."""
     global running
@@ -73,7 +73,7 @@ def print_banner():
   ╚══════════════════════════════════════════════════════════╝
 [/bold bright_blue]
 """
-    console.print(banner)
+    _get_console().print(banner)
 
 
 def print_strategy_summary():
@@ -89,11 +89,14 @@ def print_strategy_summary():
   [yellow]E.[/yellow] $1 trade at $0.50/share, 0.02% max slippage
   [yellow]F.[/yellow] Skip trade if right price not found within 5 minutes
 """
-    console.print(Panel(summary, title="🧠 Strategy", border_style="cyan"))
+    from rich.panel import Panel
+    _get_console().print(Panel(summary, title="🧠 Strategy", border_style="cyan"))
 
 
 def validate_and_start():
     """Validate configuration and start the bot."""
+    import config
+    console = _get_console()
     errors = config.validate_config()
     if errors:
         console.print("\n[bold red]❌ Configuration Errors:[/bold red]")
@@ -110,11 +113,22 @@ def validate_and_start():
     console.print()
 
 
-def run_bot():
+async def run_bot():
     """Main bot loop."""
     global running
+    # signal.signal (not loop.add_signal_handler) — works on Windows too
     signal.signal(signal.SIGINT, signal_handler)
 
+    from rich.live import Live
+
+    from candle_feed import CandleFeed, close_session
+    from trade_manager import TradeManager
+    from market_finder import MarketFinder
+    from strategy import StrategyEngine
+    from dashboard import Dashboard
+
+    console = _get_console()
+
     # Initialize components
     console.print("[dim]Initializing components...[/dim]")
     feed = CandleFeed()
@@ -139,11 +153,13 @@ def run_bot():
     dashboard_obj = Dashboard(engine=engine, feed=feed, trader=trader)
     dashboard = dashboard_obj  # Enable logging
 
-    # Initial data fetch
+    # Initial data fetch — klines + ticker concurrently
     console.print("[dim]Fetching initial candle data...[/dim]")
     try:
-        feed.fetch_recent(limit=10)
-        btc = feed.get_btc_price()
+        _, btc = await asyncio.gather(
+            feed.fetch_recent(limit=10),
+            feed.get_btc_price(),
+        )
         console.print(f"[green]✓[/green] BTC Price: ${btc:,.2f}")
         console.print(f"[green]✓[/green] Loaded {len(feed.get_closed_candles())} closed candles")
     except Exception as e:
@@ -159,43 +175,63 @@ def run_bot():
         console.print("[yellow]⚠ No active BTC 15-min market found — will use paper simulation[/yellow]")
 
     console.print("\n[bold green]✅ Bot started! Press Ctrl+C to stop.[/bold green]\n")
-    time.sleep(2)
+    await asyncio.sleep(2)
 
     # Main loop with live dashboard
     tick_interval = 5  # seconds between ticks
     last_tick = 0
+    last_render_version = None
+    last_render_pct = -1.0
 
+    # auto_refresh=False — Rich's background refresh thread would redraw
+    # the whole screen every second even when nothing changed; we refresh
+    # explicitly only when we push a new frame below.
     with Live(
         dashboard_obj.render(),
         console=console,
-        refresh_per_second=1,
+        auto_refresh=False,
         screen=True,
     ) as live:
         while running:
-            now = time.time()
+            # Monotonic clock — immune to NTP steps that would burst or
+            # starve ticks if we scheduled off wall-clock time
+            now = time.monotonic()
 
-            # Process strategy tick
+            # Process strategy tick — catch only expected recoverables;
+            # anything else propagates to the fatal handler in main()
             if now - last_tick >= tick_interval:
                 try:
-                    engine.process_tick()
-                except Exception as e:
+                    await engine.process_tick()
+                except (ConnectionError, TimeoutError, ValueError) as e:
                     dashboard_obj.add_log(f"[red]⚠ Error: {str(e)[:50]}[/red]")
                 last_tick = now
-            # Update dashboard
-            try:
-                live.update(dashboard_obj.render())
-            except Exception:
-                pass
 
-            time.sleep(0.5)
+            # Update dashboard — skip the rebuild when nothing changed and
+            # the candle progress bar hasn't visibly moved (<1% ≈ 9s).
+            # Feed, trader and engine changes land within one tick, so a
+            # single dirty mark coalesces them into one rebuild.
+            version = (feed._version, trader._version, engine._version)
+            pct = feed.candle_progress_pct()
+            if version != last_render_version:
+                dashboard_obj.mark_dirty()
+            if version != last_render_version or abs(pct - last_render_pct) >= 1.0:
+                live.update(dashboard_obj.render(), refresh=True)
+                last_render_version = version
+                last_render_pct = pct
+
+            await asyncio.sleep(0.5)
 
     # Shutdown
+    await close_session()
     console.print("\n[yellow]🛑 Bot stopped by user.[/yellow]")
     console.print(f"[dim]Total trades: {trader.total_trades} | P&L: ${trader.total_pnl:+.2f}[/dim]")
 
 
 def show_status():
     """Show current bot status and exit."""
+    from trade_manager import TradeManager
+
+    console = _get_console()
     trader = TradeManager()
     console.print("\n[bold]📊 Bot Status[/bold]\n")
     console.print(f"  Total Trades:  {trader.total_trades}")
@@ -239,7 +275,11 @@ def main():
     print_banner()
     print_strategy_summary()
     validate_and_start()
-    run_bot()
+    try:
+        asyncio.run(run_bot())
+    except Exception as e:
+        _get_console().print(f"\n[bold red]💥 Fatal error: {e}[/bold red]")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -7,14 +7,61 @@ and provides candle color tracking.
 """
 
 import time
-import requests
+import asyncio
+import aiohttp
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
-from config import BINANCE_KLINE_ENDPOINT, BTC_SYMBOL, CANDLE_INTERVAL
+from config import (
+    BINANCE_API,
+    BINANCE_KLINE_ENDPOINT,
+    BINANCE_WS_STREAM,
+    BTC_SYMBOL,
+    CANDLE_INTERVAL,
+)
+
+
+# ── Shared HTTP session ─────────────────────────────
+# One aiohttp session per process — keep-alive connections to Binance
+# instead of a fresh TCP+TLS handshake on every poll.
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300),
+            headers={"User-Agent": "polybot/1.0"},
+        )
+    return _session
+
 
+async def close_session():
+    """Close the shared aiohttp session (call on shutdown)."""
+    global _session
+    if _session and not _session.closed:
+        await _session.close()
+    _session = None
 
-@dataclass
+
+# Candle colors as ints — the strategy's hot path compares these
+# instead of building "green"/"red" strings on every property access
+COLOR_RED = 0
+COLOR_GREEN = 1
+
+
+@dataclass(slots=True, frozen=True)
 class Candle:
     """A single 15-minute BTC candle."""
     open_time: float          # Epoch ms
@@ -25,11 +72,21 @@ class Candle:
     close_price: float
     volume: float
     is_closed: bool = False
+    # Classified once at construction; -1 sentinel means "compute it"
+    color_code: int = -1
+
+    def __post_init__(self):
+        if self.color_code < 0:
+            object.__setattr__(
+                self,
+                "color_code",
+                COLOR_GREEN if self.close_price >= self.open_price else COLOR_RED,
+            )
 
     @property
     def color(self) -> str:
-        """'green' if close >= open, else 'red'."""
-        return "green" if self.close_price >= self.open_price else "red"
+        """'green' if close >= open, else 'red' (for logs/display)."""
+        return "green" if self.color_code == COLOR_GREEN else "red"
 
     @property
     def open_dt(self) -> datetime:
@@ -59,29 +116,45 @@ class CandleFeed:
 
     def __init__(self):
         self.candles: list[Candle] = []
+        self._closed: list[Candle] = []
+        self._open: list[Candle] = []
         self._last_closed_time: Optional[float] = None
+        self.last_price: float = 0.0
+        self._version = 0  # Bumped on every data refresh (render debounce)
+        # Push stream state — while the kline WebSocket is healthy the
+        # per-tick REST poll is skipped entirely
+        self._ws_task: Optional[asyncio.Task] = None
+        self._ws_last_msg: float = 0.0
+
+    async def fetch_recent(self, limit: int = 10) -> list[Candle]:
+        """Return the most recent `limit` candles.
 
-    def fetch_recent(self, limit: int = 10) -> list[Candle]:
-        """Fetch the most recent `limit` candles from Binance."""
+        Candles arrive pushed over the kline WebSocket; REST is only hit
+        for the cold-start bootstrap and to re-fill after a stream gap.
+        A 15m candle closes 4x/hour, so polling Binance every tick was
+        >99% identical responses.
+        """
+        self._ensure_stream()
+        if self.candles and (time.monotonic() - self._ws_last_msg) < 10:
+            return self.candles
         try:
-            resp = requests.get(
+            session = await _get_session()
+            async with session.get(
                 BINANCE_KLINE_ENDPOINT,
                 params={
                     "symbol": BTC_SYMBOL,
                     "interval": CANDLE_INTERVAL,
                     "limit": limit,
                 },
-                timeout=10,
-            )
-            resp.raise_for_status()
-            raw = resp.json()
+            ) as resp:
+                resp.raise_for_status()
+                raw = _json_loads(await resp.read())
         except Exception as e:
             raise ConnectionError(f"Binance API error: {e}")
 
-        candles = []
         now_ms = time.time() * 1000
-        for k in raw:
-            candle = Candle(
+        candles = [
+            Candle(
                 open_time=float(k[0]),
                 close_time=float(k[6]),
                 open_price=float(k[1]),
@@ -91,51 +164,120 @@ class CandleFeed:
                 volume=float(k[5]),
                 is_closed=(float(k[6]) < now_ms),
             )
-            candles.append(candle)
+            for k in raw
+        ]
 
         self.candles = candles
+        # Partition once per fetch — getters become plain reads instead of
+        # re-filtering the list on every dashboard/strategy call.
+        self._closed = [c for c in candles if c.is_closed]
+        self._open = [c for c in candles if not c.is_closed]
+        if candles:
+            self.last_price = candles[-1].close_price
+        self._version += 1
         return candles
 
+    def _ensure_stream(self):
+        """Start (or restart) the background kline stream task."""
+        if self._ws_task is not None and not self._ws_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Sync caller — REST path still works without the stream
+        self._ws_task = loop.create_task(self._stream_loop())
+
+    async def _stream_loop(self):
+        """Consume Binance's kline push stream, reconnecting on drops.
+
+        Each frame carries the forming candle (and its final state when
+        `x` flips true at close), so one push per ~2s replaces a REST
+        poll per tick. On disconnect, `_ws_last_msg` goes stale and
+        fetch_recent transparently falls back to REST until we're back.
+        """
+        url = f"{BINANCE_WS_STREAM}/{BTC_SYMBOL.lower()}@kline_{CANDLE_INTERVAL}"
+        while True:
+            try:
+                session = await _get_session()
+                async with session.ws_connect(url, heartbeat=30) as ws:
+                    async for msg in ws:
+                        if msg.type != aiohttp.WSMsgType.TEXT:
+                            continue
+                        kline = _json_loads(msg.data).get("k")
+                        if kline:
+                            self._apply_kline(kline)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pass
+            await asyncio.sleep(5)
+
+    def _apply_kline(self, k: dict):
+        """Merge one pushed kline frame into the candle list."""
+        candle = Candle(
+            open_time=float(k["t"]),
+            close_time=float(k["T"]),
+            open_price=float(k["o"]),
+            high_price=float(k["h"]),
+            low_price=float(k["l"]),
+            close_price=float(k["c"]),
+            volume=float(k["v"]),
+            is_closed=bool(k["x"]),
+        )
+        candles = self.candles
+        if candles and candles[-1].open_time == candle.open_time:
+            candles[-1] = candle
+        elif candles and candles[-1].open_time > candle.open_time:
+            return  # Stale frame from before a reconnect
+        else:
+            candles.append(candle)
+            if len(candles) > 10:
+                del candles[0]
+        self._closed = [c for c in candles if c.is_closed]
+        self._open = [c for c in candles if not c.is_closed]
+        self.last_price = candle.close_price
+        self._ws_last_msg = time.monotonic()
+        self._version += 1
+
     def get_closed_candles(self) -> list[Candle]:
         """Return only fully closed candles."""
-        return [c for c in self.candles if c.is_closed]
+        return self._closed
 
     def get_current_candle(self) -> Optional[Candle]:
         """Return the currently-forming (not yet closed) candle."""
-        open_candles = [c for c in self.candles if not c.is_closed]
-        return open_candles[-1] if open_candles else None
+        return self._open[-1] if self._open else None
 
     def get_last_n_closed(self, n: int) -> list[Candle]:
         """Return the last N closed candles (oldest first)."""
-        closed = self.get_closed_candles()
-        return closed[-n:] if len(closed) >= n else closed
+        return self._closed[-n:]
 
     def has_new_closed_candle(self) -> bool:
         """Check if there is a new closed candle since last check."""
-        closed = self.get_closed_candles()
-        if not closed:
+        if not self._closed:
             return False
-        latest = closed[-1].close_time
+        latest = self._closed[-1].close_time
         if self._last_closed_time is None or latest > self._last_closed_time:
             self._last_closed_time = latest
             return True
         return False
 
-    def get_btc_price(self) -> float:
+    async def get_btc_price(self) -> float:
         """Get the latest BTC price."""
         try:
-            resp = requests.get(
-                f"https://api.binance.com/api/v3/ticker/price",
+            session = await _get_session()
+            async with session.get(
+                f"{BINANCE_API}/api/v3/ticker/price",
                 params={"symbol": BTC_SYMBOL},
-                timeout=10,
-            )
-            resp.raise_for_status()
-            return float(resp.json()["price"])
+            ) as resp:
+                resp.raise_for_status()
+                data = _json_loads(await resp.read())
+            self.last_price = float(data["price"])
+            return self.last_price
         except Exception:
             # Fallback to last candle close price
             if self.candles:
-                return self.candles[-1].close_price
-            return 0.0
+                self.last_price = self.candles[-1].close_price
+            return self.last_price
 
     def seconds_until_candle_close(self) -> float:
         """Seconds until the current candle closes."""
@@ -155,3 +297,30 @@ class CandleFeed:
         total = current.close_time - current.open_time
         elapsed = now_ms - current.open_time
         return min(100.0, max(0.0, (elapsed / total) * 100))
+
+    def snapshot(self) -> dict:
+        """Current-candle timing computed once per tick.
+
+        One time.time() call and one candle lookup instead of the
+        dashboard calling each helper separately per render.
+        """
+        current = self.get_current_candle()
+        now_ms = int(time.time() * 1000)
+        if not current:
+            return {
+                "now_ms": now_ms,
+                "current": None,
+                "seconds_left": 0,
+                "pct": 100,
+            }
+        # Epoch-ms values are whole numbers — integer math avoids the
+        # float divisions on every render
+        open_ms = int(current.open_time)
+        close_ms = int(current.close_time)
+        pct = (now_ms - open_ms) * 100 // (close_ms - open_ms)
+        return {
+            "now_ms": now_ms,
+            "current": current,
+            "seconds_left": max(0, (close_ms - now_ms) // 1000),
+            "pct": max(0, min(100, pct)),
+        }
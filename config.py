@@ -23,6 +23,7 @@ CHAIN_ID = 137  # Polygon
 # ── Binance (free BTC price data) ───────────────────
 BINANCE_API = "https://api.binance.com"
 BINANCE_KLINE_ENDPOINT = f"{BINANCE_API}/api/v3/klines"
+BINANCE_WS_STREAM = "wss://stream.binance.com:9443/ws"
 BTC_SYMBOL = "BTCUSDT"
 CANDLE_INTERVAL = "15m"
 
@@ -8,7 +8,9 @@ Clean, beautiful terminal dashboard using Rich.
 import time
 import threading
 import requests
-from datetime import datetime, timezone, timedelta
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 
 from rich.console import Console
@@ -16,8 +18,6 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.layout import Layout
 from rich.text import Text
-from rich.live import Live
-from rich.columns import Columns
 from rich.align import Align
 from rich import box
 
@@ -37,6 +37,100 @@ from config import (
 )
 
 
+@lru_cache(maxsize=128)
+def _markup(content: str) -> Text:
+    """Parse Rich markup once per unique content string."""
+    return Text.from_markup(content)
+
+
+# Memoized number formatters — trade sizes, prices and P&L values repeat
+# heavily across rows and frames, so most calls become a dict lookup
+# instead of float formatting.
+@lru_cache(maxsize=256)
+def _fmt_usd(value: float) -> str:
+    return f"${value:,.2f}"
+
+
+@lru_cache(maxsize=256)
+def _fmt_signed_usd(value: float) -> str:
+    return f"${value:+.2f}"
+
+
+@lru_cache(maxsize=256)
+def _fmt_pct(value: float) -> str:
+    return f"{value:+.2f}%"
+
+
+# ── Shared icons & style lookups (built once at import) ─────────────
+GREEN_ICON = "🟢"
+RED_ICON = "🔴"
+_DIR_ICON = {TradeDirection.UP: GREEN_ICON, TradeDirection.DOWN: RED_ICON}
+_DIR_COLOR = {TradeDirection.UP: "green", TradeDirection.DOWN: "red"}
+_CANDLE_ICON = {"green": GREEN_ICON, "red": RED_ICON}
+# All 21 possible 20-cell progress bars, precomputed at import
+_BAR_LEN = 20
+_BAR_TABLE = tuple("█" * i + "░" * (_BAR_LEN - i) for i in range(_BAR_LEN + 1))
+_STATE_ICON_COLOR = {
+    BotState.SCANNING: ("🔍", "white"),
+    BotState.SIGNAL_DETECTED: ("🎯", "yellow"),
+    BotState.WAITING_ENTRY: ("⏳", "yellow"),
+    BotState.IN_TRADE: ("📊", "green"),
+    BotState.PROGRESSIVE: ("📈", "magenta"),
+    BotState.COOLDOWN: ("❄️", "blue"),
+}
+# Static column specs — (header, kwargs) per column, declared once so
+# the table builders don't repeat styling literals every rebuild
+_CANDLE_COLUMNS = (
+    ("Time", {"style": "dim", "width": 12}),
+    ("Open", {"justify": "right", "width": 10}),
+    ("Close", {"justify": "right", "width": 10}),
+    ("Change", {"justify": "right", "width": 8}),
+    ("Color", {"justify": "center", "width": 6}),
+)
+_TRADE_COLUMNS = (
+    ("#", {"style": "dim", "width": 3}),
+    ("Time", {"width": 8}),
+    ("Dir", {"width": 6}),
+    ("Candle", {"justify": "center", "width": 6}),
+    ("Amount", {"justify": "right", "width": 7}),
+    ("P&L", {"justify": "right", "width": 8}),
+    ("Status", {"justify": "center", "width": 4}),
+)
+_POSITION_COLUMNS = (
+    ("Market", {"width": 30, "no_wrap": True}),
+    ("Side", {"justify": "center", "width": 5}),
+    ("Shares", {"justify": "right", "width": 7}),
+    ("Avg $", {"justify": "right", "width": 6}),
+    ("Value", {"justify": "right", "width": 7}),
+    ("PnL", {"justify": "right", "width": 8}),
+    ("Status", {"justify": "center", "width": 8}),
+)
+# Color tag keyed by sign — skips an if/else plus string literal per cell
+_SIGN_COLOR = {True: "green", False: "red"}
+
+_POLYGON_RPC = "https://polygon-bor-rpc.publicnode.com"
+_USDC_E_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
+_USDC_ABI = [{"constant": True, "inputs": [{"name": "", "type": "address"}],
+              "name": "balanceOf", "outputs": [{"name": "", "type": "uint256"}],
+              "stateMutability": "view", "type": "function"}]
+
+
+def _new_table(columns, header_style: str) -> Table:
+    """Build a Table from a static column spec."""
+    table = Table(box=box.SIMPLE_HEAVY, show_header=True, header_style=header_style)
+    for header, kwargs in columns:
+        table.add_column(header, **kwargs)
+    return table
+
+
+# The strategy panel's state line only has one form per BotState —
+# render all six once here instead of re-formatting every rebuild
+_STATE_LINE = {
+    state: f"[bold]State:[/bold]          [{color}]{icon} {state.value}[/{color}]"
+    for state, (icon, color) in _STATE_ICON_COLOR.items()
+}
+
+
 class Dashboard:
     """Rich terminal dashboard for the bot."""
 
@@ -50,32 +144,127 @@ class Dashboard:
         self.feed = feed
         self.trader = trader
         self.console = Console()
-        self.log_lines: list[str] = []
         self.max_log_lines = 12
-        self._start_time = time.time()
-
-        # Wallet data cache (refreshed every 60s)
-        self._wallet_cache = {
-            "usdc": 0.0,
-            "matic": 0.0,
-            "positions": [],
-            "last_fetch": 0,
-        }
-        self._wallet_lock = threading.Lock()
+        # Ring buffer — deque drops the oldest line in O(1), no re-slicing
+        self.log_lines: deque[str] = deque(maxlen=self.max_log_lines)
+        self._log_lock = threading.Lock()
+        self._log_seq = 0
+        # 1-second cache of the formatted log timestamp
+        self._last_ts_int = 0
+        self._last_ts_str = ""
+        self._start_time = time.monotonic()
+
+        # Wallet data — immutable (usdc, matic, positions, last_fetch)
+        # snapshot. The worker builds a fresh tuple and swaps it in with a
+        # single attribute assignment (atomic under the GIL), so readers on
+        # the render path never take a lock.
+        self._wallet_snapshot: tuple = (0.0, 0.0, [], 0.0)
         self._WALLET_REFRESH_SEC = 60
+        # Web3 provider + USDC contract built once on first fetch —
+        # reconstructing them re-parses the ABI on every refresh
+        self._w3 = None
+        self._usdc_contract = None
+        self._wallet_addr = None
+        # Fetch off the render path — the Web3/data-api round-trips can
+        # take seconds and must never stall a frame. Paper mode has no
+        # wallet to watch, so skip the worker entirely.
+        if not PAPER_MODE:
+            threading.Thread(target=self._wallet_refresh_loop, daemon=True).start()
+
+        # Per-panel memo: name -> (cache_key, Panel). Builders return the
+        # cached Panel when their inputs haven't moved since last frame.
+        self._panel_cache: dict = {}
+        # Pre-formatted history rows keyed by trade_id — resolved trades
+        # never change, so each row is formatted exactly once
+        self._trade_row_cache: dict[str, tuple] = {}
+        # Same idea for candle-history rows, keyed by candle open time
+        self._candle_row_cache: dict[float, tuple] = {}
+
+        # Frame throttle — render() returns the last Layout unchanged when
+        # called again within the window and nothing was marked dirty
+        self._last_render_ts: float = 0.0
+        self._dirty = True
+        self._RENDER_THROTTLE_SEC = 0.2
+
+        # The Layout tree is static — build it once, update panels in place
+        self._layout = self._build_layout_skeleton()
+        # Config bar reads only constants — one Panel for the process life
+        self._config_panel = self._build_config_bar()
+        self._layout["config"].update(self._config_panel)
+
+    def _build_layout_skeleton(self) -> Layout:
+        """Construct the static Layout tree (done once)."""
+        layout = Layout()
+
+        # Main structure — paper mode has no wallet/positions row, so the
+        # bottom split (and its Panels/Tables) is never even allocated
+        rows = [
+            Layout(name="header", size=3),
+            Layout(name="config", size=3),
+            Layout(name="body"),
+        ]
+        if not PAPER_MODE:
+            rows.append(Layout(name="bottom"))
+        rows.append(Layout(name="log", size=self.max_log_lines + 4))
+        layout.split_column(*rows)
+
+        # Body: left + right columns
+        layout["body"].split_row(
+            Layout(name="left", ratio=1),
+            Layout(name="right", ratio=1),
+        )
+
+        # Left: BTC + Candles
+        layout["left"].split_column(
+            Layout(name="btc", size=8),
+            Layout(name="candles"),
+        )
+
+        # Right: Strategy + P&L
+        layout["right"].split_column(
+            Layout(name="strategy", size=12),
+            Layout(name="pnl"),
+        )
+
+        # Bottom: Wallet + Positions
+        if not PAPER_MODE:
+            layout["bottom"].split_row(
+                Layout(name="wallet", ratio=1),
+                Layout(name="positions", ratio=2),
+            )
+        return layout
 
     def add_log(self, message: str):
         """Add a log line to the activity feed."""
-        ts = datetime.now().strftime("%H:%M:%S")
-        self.log_lines.append(f"[dim]{ts}[/dim]  {message}")
-        if len(self.log_lines) > self.max_log_lines:
-            self.log_lines = self.log_lines[-self.max_log_lines:]
+        now = int(time.time())
+        # Lock — callers include the bot loop and background workers
+        with self._log_lock:
+            if now != self._last_ts_int:
+                self._last_ts_int = now
+                self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+            self.log_lines.append(f"[dim]{self._last_ts_str}[/dim]  {message}")
+            self._log_seq += 1
+        self.mark_dirty()
+
+    def mark_dirty(self):
+        """Force the next render() through the frame throttle."""
+        self._dirty = True
+
+    def _memo(self, name: str, key, builder) -> Panel:
+        """Return the cached Panel for `name` unless its inputs changed."""
+        cached = self._panel_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        panel = builder()
+        self._panel_cache[name] = (key, panel)
+        return panel
 
     def _build_header(self) -> Panel:
         """Build the header panel."""
         mode = "[bold red]🔴 PAPER MODE[/bold red]" if PAPER_MODE else "[bold green]🟢 LIVE TRADING[/bold green]"
-        uptime = time.time() - self._start_time
-        h, remainder = divmod(int(uptime), 3600)
+        # Monotonic — uptime can't jump when the wall clock is adjusted
+        uptime = int(time.monotonic() - self._start_time)
+        h, remainder = divmod(uptime, 3600)
         m, s = divmod(remainder, 60)
 
         header_text = Text()
@@ -92,31 +281,32 @@ class Dashboard:
 
     def _build_btc_panel(self) -> Panel:
         """Build the BTC price & candle panel."""
-        btc_price = self.feed.get_btc_price()
-        progress = self.feed.candle_progress_pct()
-        remaining = self.feed.seconds_until_candle_close()
+        # Cached by CandleFeed — never do network I/O on the render path
+        btc_price = self.feed.last_price
+        snap = self.feed.snapshot()
+        progress = snap["pct"]
+        remaining = snap["seconds_left"]
         remaining_min = int(remaining // 60)
         remaining_sec = int(remaining % 60)
 
-        current = self.feed.get_current_candle()
+        current = snap["current"]
         current_color = current.color if current else "—"
-        current_change = f"{current.change_pct:+.2f}%" if current else "—"
+        current_change = _fmt_pct(current.change_pct) if current else "—"
 
         # Progress bar
-        bar_len = 20
-        filled = int(bar_len * progress / 100)
-        bar = "█" * filled + "░" * (bar_len - filled)
+        filled = int(_BAR_LEN * progress / 100)
+        bar = _BAR_TABLE[filled]
         bar_color = "green" if current_color == "green" else "red" if current_color == "red" else "white"
 
         lines = [
-            f"[bold yellow]BTC Price:[/bold yellow]  [bold white]${btc_price:,.2f}[/bold white]",
+            f"[bold yellow]BTC Price:[/bold yellow]  [bold white]{_fmt_usd(btc_price)}[/bold white]",
             f"[bold]Current Candle:[/bold]  [{bar_color}]{current_color.upper()}[/{bar_color}]  {current_change}",
             f"[bold]Progress:[/bold]      [{bar_color}]{bar}[/{bar_color}] {progress:.0f}%",
             f"[bold]Closes in:[/bold]     {remaining_min}m {remaining_sec}s",
         ]
 
         return Panel(
-            "\n".join(lines),
+            _markup("\n".join(lines)),
             title="[bold yellow]₿ BTC Market[/bold yellow]",
             border_style="yellow",
             height=8,
@@ -126,23 +316,24 @@ class Dashboard:
         """Build recent candle history panel."""
         closed = self.feed.get_closed_candles()[-6:]
 
-        table = Table(box=box.SIMPLE_HEAVY, show_header=True, header_style="bold cyan")
-        table.add_column("Time", style="dim", width=12)
-        table.add_column("Open", justify="right", width=10)
-        table.add_column("Close", justify="right", width=10)
-        table.add_column("Change", justify="right", width=8)
-        table.add_column("Color", justify="center", width=6)
+        table = _new_table(_CANDLE_COLUMNS, header_style="bold cyan")
+
+        if len(self._candle_row_cache) > 32:
+            self._candle_row_cache.clear()  # Only the last 6 are shown
 
         for c in closed:
-            color = "green" if c.color == "green" else "red"
-            icon = "🟢" if c.color == "green" else "🔴"
-            table.add_row(
-                c.open_dt.strftime("%H:%M"),
-                f"${c.open_price:,.0f}",
-                f"${c.close_price:,.0f}",
-                f"[{color}]{c.change_pct:+.2f}%[/{color}]",
-                icon,
-            )
+            row = self._candle_row_cache.get(c.open_time)
+            if row is None:
+                color = c.color
+                row = (
+                    c.open_dt.strftime("%H:%M"),
+                    f"${c.open_price:,.0f}",
+                    f"${c.close_price:,.0f}",
+                    f"[{color}]{_fmt_pct(c.change_pct)}[/{color}]",
+                    _CANDLE_ICON[color],
+                )
+                self._candle_row_cache[c.open_time] = row
+            table.add_row(*row)
 
         return Panel(
             table,
@@ -153,22 +344,15 @@ class Dashboard:
     def _build_strategy_panel(self) -> Panel:
         """Build the strategy status panel."""
         state = self.engine.state
-        state_colors = {
-            BotState.SCANNING: ("🔍", "white"),
-            BotState.SIGNAL_DETECTED: ("🎯", "yellow"),
-            BotState.WAITING_ENTRY: ("⏳", "yellow"),
-            BotState.IN_TRADE: ("📊", "green"),
-            BotState.PROGRESSIVE: ("📈", "magenta"),
-            BotState.COOLDOWN: ("❄️", "blue"),
-        }
-        icon, color = state_colors.get(state.bot_state, ("❓", "white"))
+        state_line = _STATE_LINE.get(
+            state.bot_state,
+            f"[bold]State:[/bold]          ❓ {state.bot_state.value}",
+        )
 
-        lines = [
-            f"[bold]State:[/bold]          [{color}]{icon} {state.bot_state.value}[/{color}]",
-        ]
+        lines = [state_line]
 
         if state.signal_direction:
-            dir_color = "green" if state.signal_direction == TradeDirection.UP else "red"
+            dir_color = _DIR_COLOR[state.signal_direction]
             lines.append(
                 f"[bold]Signal:[/bold]         [{dir_color}]{state.signal_direction.value}[/{dir_color}]"
             )
@@ -193,7 +377,7 @@ class Dashboard:
         lines.append(f"[bold]Skipped:[/bold]        {state.skipped_signals}")
 
         return Panel(
-            "\n".join(lines),
+            _markup("\n".join(lines)),
             title="[bold magenta]🧠 Strategy[/bold magenta]",
             border_style="magenta",
             height=12,
@@ -209,53 +393,52 @@ class Dashboard:
         wr_color = "green" if wr >= 50 else "yellow" if wr >= 30 else "red"
 
         lines = [
-            f"[bold]Total P&L:[/bold]    [{pnl_color}]{pnl_icon} ${pnl:+.2f}[/{pnl_color}]",
+            f"[bold]Total P&L:[/bold]    [{pnl_color}]{pnl_icon} {_fmt_signed_usd(pnl)}[/{pnl_color}]",
             f"[bold]Total Trades:[/bold] {self.trader.total_trades}",
             f"[bold]Win Rate:[/bold]     [{wr_color}]{wr:.1f}%[/{wr_color}]",
             f"[bold]Wins:[/bold]         [green]{self.trader.wins}[/green]",
             f"[bold]Losses:[/bold]       [red]{self.trader.losses}[/red]",
-            f"[bold]Volume:[/bold]       ${self.trader.total_volume:.2f}",
+            f"[bold]Volume:[/bold]       {_fmt_usd(self.trader.total_volume)}",
         ]
 
         # Current open trade
         if self.trader.current_trade:
             t = self.trader.current_trade
-            dir_color = "green" if t.direction == TradeDirection.UP else "red"
+            dir_color = _DIR_COLOR[t.direction]
             lines.append(f"\n[bold]Open Trade:[/bold]  [{dir_color}]{t.direction_emoji}[/{dir_color}]")
-            lines.append(f"[bold]Amount:[/bold]      ${t.amount:.2f}")
+            lines.append(f"[bold]Amount:[/bold]      {_fmt_usd(t.amount)}")
             lines.append(f"[bold]Candle #:[/bold]    {t.candle_number}")
         else:
             lines.append(f"\n[dim]No open trade[/dim]")
 
         return Panel(
-            "\n".join(lines),
+            _markup("\n".join(lines)),
             title="[bold green]💰 Performance[/bold green]",
             border_style="green",
         )
 
     def _build_trade_history(self) -> Panel:
         """Build recent trade history table."""
-        table = Table(box=box.SIMPLE_HEAVY, show_header=True, header_style="bold")
-        table.add_column("#", style="dim", width=3)
-        table.add_column("Time", width=8)
-        table.add_column("Dir", width=6)
-        table.add_column("Candle", justify="center", width=6)
-        table.add_column("Amount", justify="right", width=7)
-        table.add_column("P&L", justify="right", width=8)
-        table.add_column("Status", justify="center", width=4)
+        table = _new_table(_TRADE_COLUMNS, header_style="bold")
+
+        if len(self._trade_row_cache) > 64:
+            self._trade_row_cache.clear()  # Only the last 10 are ever shown
 
         for i, t in enumerate(self.trader.recent_trades, 1):
-            pnl_color = "green" if t.pnl >= 0 else "red"
-            dir_icon = "🟢" if t.direction == TradeDirection.UP else "🔴"
-            table.add_row(
-                str(i),
-                t.entry_time,
-                dir_icon,
-                str(t.candle_number),
-                f"${t.amount:.2f}",
-                f"[{pnl_color}]${t.pnl:+.2f}[/{pnl_color}]",
-                t.status_emoji,
-            )
+            row = self._trade_row_cache.get(t.trade_id)
+            if row is None:
+                pnl_color = _SIGN_COLOR[t.pnl >= 0]
+                dir_icon = _DIR_ICON[t.direction]
+                row = (
+                    t.entry_time,
+                    dir_icon,
+                    str(t.candle_number),
+                    _fmt_usd(t.amount),
+                    f"[{pnl_color}]{_fmt_signed_usd(t.pnl)}[/{pnl_color}]",
+                    t.status_emoji,
+                )
+                self._trade_row_cache[t.trade_id] = row
+            table.add_row(str(i), *row)
 
         return Panel(
             table,
@@ -265,44 +448,69 @@ class Dashboard:
 
     def _build_activity_log(self) -> Panel:
         """Build the activity log panel."""
-        if not self.log_lines:
-            content = "[dim]Waiting for activity...[/dim]"
-        else:
+        with self._log_lock:
             content = "\n".join(self.log_lines)
+        if not content:
+            content = "[dim]Waiting for activity...[/dim]"
 
         return Panel(
-            content,
+            _markup(content),
             title="[bold]📋 Activity Log[/bold]",
             border_style="bright_black",
         )
 
+    def _wallet_refresh_loop(self):
+        """Background worker — refreshes wallet data on trades or every 60s.
+
+        Positions only move when this bot trades, so a fill (TradeManager
+        version bump) triggers an immediate refresh; the 60s timer is just
+        a safety net for out-of-band changes (manual redeems, deposits).
+        """
+        last_fetch = 0.0
+        last_trader_version = -1
+        while True:
+            now = time.monotonic()
+            if (
+                self.trader._version != last_trader_version
+                or now - last_fetch >= self._WALLET_REFRESH_SEC
+            ):
+                last_trader_version = self.trader._version
+                self._fetch_wallet_data()
+                self.mark_dirty()
+                last_fetch = now
+            time.sleep(1)
+
     def _fetch_wallet_data(self):
-        """Fetch wallet balance and positions (cached, refreshes every 60s)."""
+        """Fetch wallet balance and positions (runs on the worker thread)."""
         now = time.time()
-        if now - self._wallet_cache["last_fetch"] < self._WALLET_REFRESH_SEC:
-            return  # Use cached data
-
+        # Start from the last snapshot so a partial failure keeps the
+        # previous values on screen
+        usdc_bal, matic_bal, positions, _ = self._wallet_snapshot
         try:
             if HAS_WEB3 and FUNDER_ADDRESS and not PAPER_MODE:
-                w3 = Web3(Web3.HTTPProvider("https://polygon-bor-rpc.publicnode.com"))
-                wallet = Web3.to_checksum_address(FUNDER_ADDRESS)
-
-                # USDC.e balance
-                usdc_abi = [{"constant":True,"inputs":[{"name":"","type":"address"}],
-                    "name":"balanceOf","outputs":[{"name":"","type":"uint256"}],
-                    "stateMutability":"view","type":"function"}]
-                usdc = w3.eth.contract(
-                    address=Web3.to_checksum_address("0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"),
-                    abi=usdc_abi
-                )
-                usdc_bal = usdc.functions.balanceOf(wallet).call() / 1e6
-
-                # MATIC balance
-                matic_bal = w3.eth.get_balance(wallet) / 1e18
+                if self._w3 is None:
+                    self._w3 = Web3(Web3.HTTPProvider(
+                        _POLYGON_RPC, request_kwargs={"timeout": 5}
+                    ))
+                    self._wallet_addr = Web3.to_checksum_address(FUNDER_ADDRESS)
+                    self._usdc_contract = self._w3.eth.contract(
+                        address=Web3.to_checksum_address(_USDC_E_ADDRESS),
+                        abi=_USDC_ABI,
+                    )
 
-                with self._wallet_lock:
-                    self._wallet_cache["usdc"] = usdc_bal
-                    self._wallet_cache["matic"] = matic_bal
+                # USDC.e and MATIC balances are independent RPC reads —
+                # issue both at once so the refresh costs one round-trip
+                # (same pattern as redeem.py's balance/trades fetch)
+                balance_of = self._usdc_contract.functions.balanceOf(
+                    self._wallet_addr
+                )
+                with ThreadPoolExecutor(max_workers=2) as ex:
+                    usdc_future = ex.submit(balance_of.call)
+                    matic_future = ex.submit(
+                        self._w3.eth.get_balance, self._wallet_addr
+                    )
+                    usdc_bal = usdc_future.result() / 1e6
+                    matic_bal = matic_future.result() / 1e18
 
                 # Positions from data-api
                 try:
@@ -311,33 +519,25 @@ class Dashboard:
                         timeout=8
                     )
                     if r.status_code == 200:
-                        with self._wallet_lock:
-                            self._wallet_cache["positions"] = r.json()
+                        positions = r.json()
                 except Exception:
                     pass
-
-            with self._wallet_lock:
-                self._wallet_cache["last_fetch"] = now
-
         except Exception:
-            with self._wallet_lock:
-                self._wallet_cache["last_fetch"] = now  # Avoid hammering on error
+            pass  # Keep stale values; last_fetch still advances below
+
+        # One atomic pointer swap publishes the whole snapshot
+        self._wallet_snapshot = (usdc_bal, matic_bal, positions, now)
 
     def _build_wallet_panel(self) -> Panel:
         """Build the wallet balance and positions panel."""
-        self._fetch_wallet_data()
-
-        with self._wallet_lock:
-            usdc = self._wallet_cache["usdc"]
-            matic = self._wallet_cache["matic"]
-            positions = self._wallet_cache["positions"]
+        usdc, matic, positions, _ = self._wallet_snapshot
 
         if PAPER_MODE:
             lines = [
                 "[dim]Wallet info not available in Paper Mode[/dim]",
             ]
             return Panel(
-                "\n".join(lines),
+                _markup("\n".join(lines)),
                 title="[bold bright_cyan]👛 Wallet[/bold bright_cyan]",
                 border_style="bright_cyan",
                 height=6,
@@ -355,16 +555,16 @@ class Dashboard:
 
         lines = [
             f"[bold]Wallet:[/bold]      [dim]{short_addr}[/dim]",
-            f"[bold]USDC.e:[/bold]      [bold white]${usdc:.2f}[/bold white]",
+            f"[bold]USDC.e:[/bold]      [bold white]{_fmt_usd(usdc)}[/bold white]",
             f"[bold]MATIC:[/bold]       [dim]{matic:.4f}[/dim]",
         ]
 
         if positions:
             lines.append(f"")
             lines.append(f"[bold]Positions:[/bold]   {len(positions)} active")
-            lines.append(f"[bold]Holdings:[/bold]    [bold white]${total_value:.2f}[/bold white]")
-            lines.append(f"[bold]Pos. PnL:[/bold]    [{pnl_color}]${total_pnl:+.2f}[/{pnl_color}]")
-            lines.append(f"[bold]Total Equity:[/bold][bold yellow] ${usdc + total_value:.2f}[/bold yellow]")
+            lines.append(f"[bold]Holdings:[/bold]    [bold white]{_fmt_usd(total_value)}[/bold white]")
+            lines.append(f"[bold]Pos. PnL:[/bold]    [{pnl_color}]{_fmt_signed_usd(total_pnl)}[/{pnl_color}]")
+            lines.append(f"[bold]Total Equity:[/bold][bold yellow] {_fmt_usd(usdc + total_value)}[/bold yellow]")
         else:
             lines.append(f"")
             lines.append(f"[dim]No active positions[/dim]")
@@ -372,24 +572,16 @@ class Dashboard:
         height = max(8, 5 + len(positions) * 3)
 
         return Panel(
-            "\n".join(lines),
+            _markup("\n".join(lines)),
             title="[bold bright_cyan]👛 Wallet & Holdings[/bold bright_cyan]",
             border_style="bright_cyan",
         )
 
     def _build_positions_table(self) -> Panel:
         """Build the active positions table."""
-        with self._wallet_lock:
-            positions = self._wallet_cache["positions"]
-
-        table = Table(box=box.SIMPLE_HEAVY, show_header=True, header_style="bold bright_cyan")
-        table.add_column("Market", width=30, no_wrap=True)
-        table.add_column("Side", justify="center", width=5)
-        table.add_column("Shares", justify="right", width=7)
-        table.add_column("Avg $", justify="right", width=6)
-        table.add_column("Value", justify="right", width=7)
-        table.add_column("PnL", justify="right", width=8)
-        table.add_column("Status", justify="center", width=8)
+        positions = self._wallet_snapshot[2]
+
+        table = _new_table(_POSITION_COLUMNS, header_style="bold bright_cyan")
 
         if not positions:
             table.add_row("[dim]No positions[/dim]", "", "", "", "", "", "")
@@ -412,7 +604,7 @@ class Dashboard:
                 redeemable = p.get("redeemable", False)
                 cur_price = float(p.get("curPrice", 0))
 
-                pnl_color = "green" if cash_pnl >= 0 else "red"
+                pnl_color = _SIGN_COLOR[cash_pnl >= 0]
 
                 if redeemable and cur_price >= 0.95:
                     status = "[bold green]WIN ✅[/bold green]"
@@ -427,9 +619,9 @@ class Dashboard:
                     title,
                     f"[{side_color}]{side_icon}[/{side_color}]",
                     f"{size:.0f}",
-                    f"${avg_price:.2f}",
-                    f"${cur_value:.2f}",
-                    f"[{pnl_color}]${cash_pnl:+.2f}[/{pnl_color}]",
+                    _fmt_usd(avg_price),
+                    _fmt_usd(cur_value),
+                    f"[{pnl_color}]{_fmt_signed_usd(cash_pnl)}[/{pnl_color}]",
                     status,
                 )
 
@@ -458,51 +650,45 @@ class Dashboard:
         )
 
     def render(self) -> Layout:
-        """Build the full dashboard layout."""
-        layout = Layout()
-
-        # Main structure
-        layout.split_column(
-            Layout(name="header", size=3),
-            Layout(name="config", size=3),
-            Layout(name="body"),
-            Layout(name="bottom"),
-            Layout(name="log", size=self.max_log_lines + 4),
-        )
-
-        # Body: left + right columns
-        layout["body"].split_row(
-            Layout(name="left", ratio=1),
-            Layout(name="right", ratio=1),
-        )
-
-        # Left: BTC + Candles
-        layout["left"].split_column(
-            Layout(name="btc", size=8),
-            Layout(name="candles"),
-        )
-
-        # Right: Strategy + P&L
-        layout["right"].split_column(
-            Layout(name="strategy", size=12),
-            Layout(name="pnl"),
-        )
-
-        # Bottom: Wallet + Positions
-        layout["bottom"].split_row(
-            Layout(name="wallet", ratio=1),
-            Layout(name="positions", ratio=2),
+        """Update panels on the prebuilt layout and return it."""
+        now = time.monotonic()
+        if (
+            self._last_render_ts > 0
+            and not self._dirty
+            and now - self._last_render_ts < self._RENDER_THROTTLE_SEC
+        ):
+            return self._layout
+
+        layout = self._layout
+
+        # Cache keys — version counters stand in for the field tuples they
+        # used to enumerate: the feed bumps on every fetch, the engine on
+        # every state transition. Only the clock-driven parts (progress,
+        # countdowns) still appear explicitly.
+        snap = self.feed.snapshot()
+        state = self.engine.state
+        uptime_key = int(time.monotonic() - self._start_time)
+        btc_key = (self.feed._version, snap["pct"], snap["seconds_left"])
+        candles_key = (self.feed._version,)
+        strategy_key = (
+            self.engine._version,
+            int(state.cooldown_remaining_sec),
+            int(state.entry_wait_elapsed_sec),
         )
+        trader_key = (self.trader._version,)
 
         # Render panels
-        layout["header"].update(self._build_header())
-        layout["config"].update(self._build_config_bar())
-        layout["btc"].update(self._build_btc_panel())
-        layout["candles"].update(self._build_candle_history())
-        layout["strategy"].update(self._build_strategy_panel())
-        layout["pnl"].update(self._build_pnl_panel())
-        layout["wallet"].update(self._build_wallet_panel())
-        layout["positions"].update(self._build_positions_table())
-        layout["log"].update(self._build_activity_log())
-
+        layout["header"].update(self._memo("header", uptime_key, self._build_header))
+        layout["btc"].update(self._memo("btc", btc_key, self._build_btc_panel))
+        layout["candles"].update(self._memo("candles", candles_key, self._build_candle_history))
+        layout["strategy"].update(self._memo("strategy", strategy_key, self._build_strategy_panel))
+        layout["pnl"].update(self._memo("pnl", trader_key, self._build_pnl_panel))
+        if not PAPER_MODE:
+            wallet_key = (self._wallet_snapshot[3],)
+            layout["wallet"].update(self._memo("wallet", wallet_key, self._build_wallet_panel))
+            layout["positions"].update(self._memo("positions", wallet_key, self._build_positions_table))
+        layout["log"].update(self._memo("log", self._log_seq, self._build_activity_log))
+
+        self._last_render_ts = now
+        self._dirty = False
         return layout
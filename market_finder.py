@@ -7,9 +7,17 @@ using the Gamma API. Updated with correct token parsing.
 """
 
 import time
-import math
-import json
+import asyncio
+import threading
 import requests
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 from config import GAMMA_API, CLOB_HOST
@@ -37,35 +45,60 @@ class BTCMarket:
 
     @property
     def is_tradeable(self) -> bool:
-        return self.active and self.accepting_orders and not self.is_expired
+        return self.is_tradeable_at(time.time())
 
     @property
     def is_expired(self) -> bool:
         return time.time() > self.end_time
 
+    # `now`-taking variants — callers that already hold a clock snapshot
+    # (cache checks, boundary loops) reuse it instead of re-reading time
+    def is_tradeable_at(self, now: float) -> bool:
+        return self.active and self.accepting_orders and now <= self.end_time
+
 
 class MarketFinder:
     """Finds BTC 15-minute UP/DOWN markets on Polymarket."""
 
-    def __init__(self):
+    def __init__(self, cache_ttl: float = 30):
         self.session = requests.Session()
         self.session.headers.update({"Accept": "application/json"})
+        # Fan the boundary probes out in parallel — wall time becomes one
+        # RTT instead of four, over the session's pooled connections
+        self._executor = ThreadPoolExecutor(max_workers=4)
         self._cache: Optional[BTCMarket] = None
         self._cache_time: float = 0
-        self._cache_ttl: float = 30  # Cache for 30 seconds
+        self._cache_ttl: float = cache_ttl
+        # Single-flight refresh — concurrent callers at TTL expiry wait for
+        # one fetch instead of each running the boundary query themselves
+        self._cache_lock = threading.Lock()
+        # Slugs that returned null this bucket — a past boundary that has
+        # no market now never will, so don't re-probe it every refresh
+        self._known_bad_slugs: dict[str, int] = {}
+        # Boundaries and slug strings are constant within a 15m bucket —
+        # (bucket_id, boundaries, slugs), rebuilt only when the bucket rolls
+        self._boundary_cache: tuple[int, list[int], list[str]] = (-1, [], [])
 
     def _get_15m_boundaries(self) -> list[int]:
         """Get epoch timestamps for 15-minute boundaries."""
-        now = time.time()
+        return self._get_boundaries_and_slugs()[0]
+
+    def _get_boundaries_and_slugs(self) -> tuple[list[int], list[str]]:
+        """Boundaries plus their slug strings, cached per 15m bucket."""
         interval = 15 * 60
-        current = math.floor(now / interval) * interval
-        # Return: prev, current, next, next+1
-        return [
-            current - interval,
-            current,
-            current + interval,
-            current + interval * 2,
-        ]
+        bucket = int(time.time()) // interval
+        if bucket != self._boundary_cache[0]:
+            current = bucket * interval
+            # prev, current, next, next+1
+            boundaries = [
+                current - interval,
+                current,
+                current + interval,
+                current + interval * 2,
+            ]
+            slugs = [f"btc-updown-15m-{epoch}" for epoch in boundaries]
+            self._boundary_cache = (bucket, boundaries, slugs)
+        return self._boundary_cache[1], self._boundary_cache[2]
 
     def _parse_market(self, data: dict) -> Optional[BTCMarket]:
         """Parse a Gamma API market response into BTCMarket."""
@@ -73,7 +106,7 @@ class MarketFinder:
             # Parse clobTokenIds — it's a JSON string like '["id1", "id2"]'
             clob_ids_raw = data.get("clobTokenIds", "[]")
             if isinstance(clob_ids_raw, str):
-                clob_ids = json.loads(clob_ids_raw)
+                clob_ids = _json_loads(clob_ids_raw)
             else:
                 clob_ids = clob_ids_raw
 
@@ -83,20 +116,21 @@ class MarketFinder:
             # Parse outcomes — '["Up", "Down"]'
             outcomes_raw = data.get("outcomes", '["Up", "Down"]')
             if isinstance(outcomes_raw, str):
-                outcomes = json.loads(outcomes_raw)
+                outcomes = _json_loads(outcomes_raw)
             else:
                 outcomes = outcomes_raw
 
-            # Map outcomes to token IDs
-            token_id_up = ""
-            token_id_down = ""
-            for i, outcome in enumerate(outcomes):
-                if i >= len(clob_ids):
-                    break
-                if outcome.lower() in ("up", "yes"):
-                    token_id_up = clob_ids[i]
-                elif outcome.lower() in ("down", "no"):
-                    token_id_down = clob_ids[i]
+            if not outcomes:
+                return None
+
+            # Map outcomes to token IDs — one pass, one casefold per outcome
+            outcome_map = {
+                o.casefold(): clob_ids[i]
+                for i, o in enumerate(outcomes)
+                if i < len(clob_ids)
+            }
+            token_id_up = outcome_map.get("up") or outcome_map.get("yes", "")
+            token_id_down = outcome_map.get("down") or outcome_map.get("no", "")
 
             if not token_id_up or not token_id_down:
                 return None
@@ -104,7 +138,7 @@ class MarketFinder:
             # Parse outcome prices — '["0.515", "0.485"]'
             prices_raw = data.get("outcomePrices", '["0.5", "0.5"]')
             if isinstance(prices_raw, str):
-                prices = json.loads(prices_raw)
+                prices = _json_loads(prices_raw)
             else:
                 prices = prices_raw
 
@@ -148,41 +182,97 @@ class MarketFinder:
         except Exception:
             return None
 
+    def _fetch_slug(self, slug: str) -> Optional[BTCMarket]:
+        """Fetch and parse one market by slug (None on miss/error)."""
+        try:
+            resp = self.session.get(
+                f"{GAMMA_API}/markets/slug/{slug}",
+                timeout=10,
+            )
+            if resp.status_code != 200:
+                return None
+            text = resp.text.strip()
+            if text == "null" or not text:
+                return None
+            return self._parse_market(_json_loads(resp.content))
+        except Exception:
+            return None
+
+    def _fetch_slugs_batch(self, slugs: list[str]) -> Optional[list[BTCMarket]]:
+        """Fetch several markets in one /markets list query.
+
+        Returns None (not []) when the batch endpoint itself fails, so the
+        caller can fall back to per-slug probes.
+        """
+        try:
+            resp = self.session.get(
+                f"{GAMMA_API}/markets",
+                params={"slug": slugs},
+                timeout=10,
+            )
+            if resp.status_code != 200:
+                return None
+            data = _json_loads(resp.content)
+            if not isinstance(data, list):
+                return None
+            return [m for m in map(self._parse_market, data) if m]
+        except Exception:
+            return None
+
+    def _cache_fresh(self) -> bool:
+        now = time.time()
+        return (
+            self._cache is not None
+            and (now - self._cache_time) < self._cache_ttl
+            and self._cache.is_tradeable_at(now)
+        )
+
     def find_current_market(self) -> Optional[BTCMarket]:
         """Find the current active BTC 15-minute UP/DOWN market."""
-        # Return cache if fresh
-        if self._cache and (time.time() - self._cache_time) < self._cache_ttl:
-            if self._cache.is_tradeable:
+        if self._cache_fresh():
+            return self._cache
+        with self._cache_lock:
+            # Re-check under the lock — another caller may have refreshed
+            # while we waited
+            if self._cache_fresh():
                 return self._cache
+            return self._refresh_current_market()
 
-        boundaries = self._get_15m_boundaries()
+    def _refresh_current_market(self) -> Optional[BTCMarket]:
+        """Run the boundary query and update the cache (lock held)."""
+        boundaries, slugs = self._get_boundaries_and_slugs()
         best_market = None
         now = time.time()
+        bucket = self._boundary_cache[0]
+
+        # Drop known-bad entries from previous buckets, then skip slugs
+        # that already came back null this bucket
+        if self._known_bad_slugs:
+            self._known_bad_slugs = {
+                s: b for s, b in self._known_bad_slugs.items() if b == bucket
+            }
+        probe = [s for s in slugs if s not in self._known_bad_slugs]
+        if not probe:
+            return None
 
-        for epoch in boundaries:
-            slug = f"btc-updown-15m-{int(epoch)}"
-            try:
-                resp = self.session.get(
-                    f"{GAMMA_API}/markets/slug/{slug}",
-                    timeout=10,
-                )
-                if resp.status_code != 200:
-                    continue
-
-                text = resp.text.strip()
-                if text == "null" or not text:
-                    continue
-
-                data = resp.json()
-                market = self._parse_market(data)
-
-                if market and market.is_tradeable and market.end_time > now:
-                    # Prefer the market closest to expiry but still open
-                    if best_market is None or market.end_time < best_market.end_time:
-                        best_market = market
-
-            except Exception:
-                continue
+        # One batched Gamma query for all four boundaries; per-slug fanout
+        # only if the list endpoint misbehaves
+        markets = self._fetch_slugs_batch(probe)
+        if markets is None:
+            markets = list(self._executor.map(self._fetch_slug, probe))
+
+        found_slugs = {m.slug for m in markets if m}
+        for slug, epoch in zip(slugs, boundaries):
+            # Only already-started boundaries are definitively bad — a
+            # future boundary's market may still materialize mid-bucket
+            if slug in probe and slug not in found_slugs and epoch <= now:
+                self._known_bad_slugs[slug] = bucket
+
+        for market in markets:
+            if market and market.is_tradeable_at(now):
+                # Prefer the market closest to expiry but still open
+                if best_market is None or market.end_time < best_market.end_time:
+                    best_market = market
 
         # Update cache
         if best_market:
@@ -191,28 +281,49 @@ class MarketFinder:
 
         return best_market
 
+    async def afind_current_market(self) -> Optional[BTCMarket]:
+        """find_current_market without blocking the event loop.
+
+        Fresh cache hits return inline; otherwise the sync implementation
+        (single-flight lock, batch query, fallback fanout) runs on the
+        default executor so the bot's asyncio loop keeps ticking through
+        the Gamma round-trip. Runs off-loop rather than on self._executor,
+        whose four workers the fallback fanout may need.
+        """
+        if self._cache_fresh():
+            return self._cache
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.find_current_market)
+
+    async def arefresh_market_prices(self, market: BTCMarket) -> BTCMarket:
+        """refresh_market_prices without blocking the event loop.
+
+        The UP and DOWN midpoints are independent CLOB requests, so
+        they run concurrently — one round-trip of wall time instead of
+        two, every WAITING_ENTRY retry.
+        """
+        loop = asyncio.get_running_loop()
+        up_price, down_price = await asyncio.gather(
+            loop.run_in_executor(None, self.get_live_price, market.token_id_up),
+            loop.run_in_executor(None, self.get_live_price, market.token_id_down),
+        )
+        if up_price is not None:
+            market.price_up = up_price
+        if down_price is not None:
+            market.price_down = down_price
+        return market
+
     def find_next_market(self) -> Optional[BTCMarket]:
         """Find the upcoming (next) BTC 15-minute market."""
-        boundaries = self._get_15m_boundaries()
+        boundaries, slugs = self._get_boundaries_and_slugs()
         now = time.time()
 
-        for epoch in boundaries:
+        for epoch, slug in zip(boundaries, slugs):
             if epoch <= now:
                 continue
-            slug = f"btc-updown-15m-{int(epoch)}"
-            try:
-                resp = self.session.get(
-                    f"{GAMMA_API}/markets/slug/{slug}",
-                    timeout=10,
-                )
-                if resp.status_code == 200:
-                    text = resp.text.strip()
-                    if text != "null" and text:
-                        market = self._parse_market(resp.json())
-                        if market:
-                            return market
-            except Exception:
-                continue
+            market = self._fetch_slug(slug)
+            if market:
+                return market
         return None
 
     def get_live_price(self, token_id: str) -> Optional[float]:
@@ -224,7 +335,7 @@ class MarketFinder:
                 timeout=10,
             )
             if resp.status_code == 200:
-                data = resp.json()
+                data = _json_loads(resp.content)
                 mid = data.get("mid")
                 if mid:
                     return float(mid)
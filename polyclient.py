@@ -0,0 +1,105 @@
+"""
+╔══════════════════════════════════════════════════════╗
+║   POLYMARKET BTC STRATEGY BOT — SHARED CLOB CLIENT  ║
+╚══════════════════════════════════════════════════════╝
+One memoized ClobClient bootstrap shared by the bot and the redeem
+script. API credentials are derived once and cached on disk, so repeat
+invocations skip the derivation round-trip and EIP-712 signing.
+"""
+
+import os
+import json
+
+from config import CLOB_HOST, CHAIN_ID, PRIVATE_KEY, FUNDER_ADDRESS, SIGNATURE_TYPE
+
+_CREDS_FILE = os.path.join(os.path.expanduser("~"), ".polybot", "creds.json")
+_client = None
+
+
+def _load_cached_creds(address: str):
+    """Return cached ApiCreds for `address`, or None if absent/stale."""
+    try:
+        with open(_CREDS_FILE) as f:
+            data = json.load(f)
+        if data.get("address", "").lower() != address.lower():
+            return None  # Creds belong to a different wallet
+        from py_clob_client.clob_types import ApiCreds
+        return ApiCreds(**data["creds"])
+    except Exception:
+        return None
+
+
+def _save_cached_creds(address: str, creds):
+    """Persist derived creds (0600) so the next run skips derivation."""
+    try:
+        os.makedirs(os.path.dirname(_CREDS_FILE), exist_ok=True)
+        data = {
+            "address": address,
+            "creds": {
+                "api_key": creds.api_key,
+                "api_secret": creds.api_secret,
+                "api_passphrase": creds.api_passphrase,
+            },
+        }
+        fd = os.open(_CREDS_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+    except Exception:
+        pass  # Cache is best-effort — derivation still runs next time
+
+
+def _mount_pooled_session(client):
+    """Swap the client's HTTP transport for a pooled keep-alive session.
+
+    py_clob_client issues each request through requests' module-level
+    helpers, paying a TCP+TLS handshake per call — directly on the
+    order-placement path. Injecting a Session with an HTTPAdapter pool
+    amortizes the handshake across every CLOB call. Best-effort: the
+    client works unchanged if the library's internals don't take it.
+    """
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.headers.update({"Connection": "keep-alive"})
+        session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0),
+        )
+        for holder in (client, getattr(client, "http_client", None)):
+            if holder is not None and hasattr(holder, "session"):
+                holder.session = session
+                return
+        # Common fallback: the helpers module calls requests.<verb>
+        import py_clob_client.http_helpers.helpers as _h
+        if hasattr(_h, "requests"):
+            _h.requests = session
+    except Exception:
+        pass
+
+
+def get_clob_client():
+    """Build (once per process) and return the authenticated ClobClient."""
+    global _client
+    if _client is not None:
+        return _client
+
+    from py_clob_client.client import ClobClient
+
+    client = ClobClient(
+        CLOB_HOST,
+        key=PRIVATE_KEY,
+        chain_id=CHAIN_ID,
+        signature_type=SIGNATURE_TYPE,
+        funder=FUNDER_ADDRESS,
+    )
+    _mount_pooled_session(client)
+    creds = _load_cached_creds(FUNDER_ADDRESS)
+    if creds is None:
+        creds = client.create_or_derive_api_creds()
+        _save_cached_creds(FUNDER_ADDRESS, creds)
+    client.set_api_creds(creds)
+
+    _client = client
+    return _client
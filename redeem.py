@@ -12,7 +12,6 @@ Usage:
 import sys
 import os
 import argparse
-import time
 import requests
 
 # Force UTF-8 for Windows terminal
@@ -26,14 +25,16 @@ if sys.platform == "win32":
 
 from web3 import Web3
 from dotenv import load_dotenv
-from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import BalanceAllowanceParams, AssetType
+
+from redeem_manager import (
+    PARENT_COLLECTION_ID, USDC_E_CS, batch_payout_denominators,
+    batch_wallet_state, get_trades_cached, make_w3,
+)
 
 load_dotenv()
 
 PRIVATE_KEY = os.getenv("PRIVATE_KEY")
 WALLET = os.getenv("FUNDER_ADDRESS")
-SIGNATURE_TYPE = int(os.getenv("SIGNATURE_TYPE", "0"))
 CHAIN_ID = 137
 
 RPC = "https://polygon-bor-rpc.publicnode.com"
@@ -63,6 +64,15 @@ CTF_ABI = [
         "outputs": [{"name": "", "type": "uint256"}],
         "stateMutability": "view",
         "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "bytes32", "name": "conditionId", "type": "bytes32"}
+        ],
+        "name": "payoutDenominator",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
     }
 ]
 
@@ -75,7 +85,7 @@ ERC20_ABI = [
 
 def get_usdc_balance(w3):
     """Get USDC.e balance on-chain."""
-    usdc = w3.eth.contract(address=Web3.to_checksum_address(USDC_E), abi=ERC20_ABI)
+    usdc = w3.eth.contract(address=USDC_E_CS, abi=ERC20_ABI)
     return usdc.functions.balanceOf(Web3.to_checksum_address(WALLET)).call() / 1e6
 
 
@@ -89,24 +99,18 @@ def main():
     print("=" * 60)
     print(f"  Wallet: {WALLET}")
 
-    # Connect to blockchain
-    w3 = Web3(Web3.HTTPProvider(RPC))
+    # Connect to blockchain (pooled keep-alive session)
+    w3 = make_w3(RPC)
     wallet = Web3.to_checksum_address(WALLET)
     ctf = w3.eth.contract(address=CTF_ADDRESS, abi=CTF_ABI)
 
-    # Get USDC balance before
-    usdc_before = get_usdc_balance(w3)
-    print(f"  USDC.e Balance: ${usdc_before:.2f}")
+    # Connect to CLOB API (shared bootstrap, creds cached on disk)
+    from polyclient import get_clob_client
+    client = get_clob_client()
 
-    # Connect to CLOB API
-    client = ClobClient(CLOB_HOST, key=PRIVATE_KEY, chain_id=CHAIN_ID,
-                       signature_type=SIGNATURE_TYPE, funder=WALLET)
-    creds = client.create_or_derive_api_creds()
-    client.set_api_creds(creds)
-
-    # Get all trades
-    trades = client.get_trades()
+    trades = get_trades_cached(client)
     if not trades:
+        print(f"  USDC.e Balance: ${get_usdc_balance(w3):.2f}")
         print("\n  No trades found.")
         return
 
@@ -119,8 +123,17 @@ def main():
         cond_id = t.get('market')
         if aid and cond_id:
             if aid not in positions:
+                # bytes32 form computed once here — the tx builder would
+                # otherwise re-validate the hex string per redemption
+                try:
+                    cond_bytes = bytes.fromhex(
+                        cond_id[2:] if cond_id.startswith('0x') else cond_id
+                    )
+                except ValueError:
+                    continue
                 positions[aid] = {
                     'condition_id': cond_id,
+                    'cond_bytes': cond_bytes,
                     'side': t.get('side', 'BUY'),
                     'outcome': t.get('outcome', '?'),
                     'price': float(t.get('price', 0)),
@@ -136,8 +149,46 @@ def main():
     redeemed = 0
     total_redeemed_value = 0.0
 
+    # Starting USDC balance and every CTF balance in one Multicall3
+    # round-trip (falls back to individual calls if the batch fails)
+    usdc_before, balances = batch_wallet_state(w3, ctf, wallet, list(positions))
+    print(f"  USDC.e Balance: ${usdc_before:.2f}\n")
+
+    # Resolution check for every held market in one batched read —
+    # payoutDenominator stays 0 until the oracle reports, and a redeem
+    # tx sent before that just reverts and burns gas
+    held_conds = list(dict.fromkeys(
+        info['cond_bytes'] for aid, info in positions.items()
+        if balances.get(aid, 0) > 0
+    ))
+    denoms = batch_payout_denominators(w3, ctf, held_conds)
+
+    # Phase 1: sign and broadcast every redemption back-to-back with
+    # locally incremented nonces — no per-tx nonce refetch, no sleeps.
+    # Receipts are collected in phase 2, so K winners cost ~one receipt
+    # wait instead of K sequential ones.
+    base_nonce = None
+    gas_price = None
+    pending = []  # (aid, info, shares, tx_hash)
+    sent_conds = set()  # One tx per conditionId redeems both outcomes
+
+    def send_redeem(info, nonce):
+        tx = ctf.functions.redeemPositions(
+            USDC_E_CS,
+            PARENT_COLLECTION_ID,
+            info['cond_bytes'],
+            [1, 2]
+        ).build_transaction({
+            "chainId": CHAIN_ID,
+            "from": wallet,
+            "nonce": nonce,
+            "gasPrice": gas_price,
+        })
+        signed = w3.eth.account.sign_transaction(tx, private_key=PRIVATE_KEY)
+        return w3.eth.send_raw_transaction(signed.raw_transaction)
+
     for aid, info in positions.items():
-        balance = ctf.functions.balanceOf(wallet, int(aid)).call()
+        balance = balances.get(aid, 0)
         shares = balance / 1e6
 
         if balance == 0:
@@ -159,24 +210,46 @@ def main():
             print()
             continue
 
-        # Try to redeem
+        # Broadcast the redemption — skip if this market's sibling outcome
+        # was already broadcast (indexSets [1, 2] covers both)
+        if info['condition_id'] in sent_conds:
+            print(f"     ↩ Covered by an earlier tx for the same market")
+            print()
+            continue
+        if denoms.get(info['cond_bytes'], 0) == 0:
+            print(f"     ⏳ Market not resolved yet — skipping redeem TX")
+            print()
+            continue
         try:
-            nonce = w3.eth.get_transaction_count(wallet)
-            tx = ctf.functions.redeemPositions(
-                Web3.to_checksum_address(USDC_E),
-                "0x" + "0" * 64,
-                Web3.to_bytes(hexstr=info['condition_id']),
-                [1, 2]
-            ).build_transaction({
-                "chainId": CHAIN_ID,
-                "from": wallet,
-                "nonce": nonce,
-                "gasPrice": int(w3.eth.gas_price * 1.3),
-            })
-
-            signed = w3.eth.account.sign_transaction(tx, private_key=PRIVATE_KEY)
-            tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
+            if base_nonce is None:
+                # One nonce + gas-price fetch for the whole run
+                base_nonce = w3.eth.get_transaction_count(wallet, "pending")
+                gas_price = int(w3.eth.gas_price * 1.3)
+            try:
+                tx_hash = send_redeem(info, base_nonce)
+            except Exception as e:
+                if "nonce too low" not in str(e).lower():
+                    raise
+                # Wallet was used concurrently — re-sync once and retry
+                base_nonce = w3.eth.get_transaction_count(wallet, "pending")
+                tx_hash = send_redeem(info, base_nonce)
+            base_nonce += 1
+            sent_conds.add(info['condition_id'])
+            pending.append((aid, info, shares, tx_hash))
             print(f"     ⏳ Redeeming... TX: {tx_hash.hex()[:20]}...")
+            print()
+
+        except Exception as e:
+            err = str(e)
+            if "execution reverted" in err.lower():
+                print(f"     ⏳ Market not resolved yet — cannot redeem")
+            else:
+                print(f"     ❌ Error: {err[:80]}")
+            print()
+
+    # Phase 2: wait for all broadcast txs to confirm
+    for aid, info, shares, tx_hash in pending:
+        try:
             receipt = w3.eth.wait_for_transaction_receipt(tx_hash, 180)
 
             if receipt['status'] == 1:
@@ -188,22 +261,15 @@ def main():
                     redeemed += 1
                     value = shares  # Each winning share = $1.00, minus cost
                     total_redeemed_value += value
-                    print(f"     ✅ WIN! Redeemed {shares:.2f} shares → ${value:.2f} USDC")
+                    print(f"  ✅ WIN! Redeemed {shares:.2f} shares → ${value:.2f} USDC")
                 else:
                     # Partial or market not resolved yet
-                    print(f"     ⏳ Market not resolved yet. Shares still held.")
+                    print(f"  ⏳ {info['outcome']}: market not resolved yet. Shares still held.")
             else:
-                print(f"     ❌ Redeem TX reverted (market may not be resolved yet)")
-            print()
-            time.sleep(3)  # Avoid rate limits
+                print(f"  ❌ {info['outcome']}: redeem TX reverted (market may not be resolved yet)")
 
         except Exception as e:
-            err = str(e)
-            if "execution reverted" in err.lower():
-                print(f"     ⏳ Market not resolved yet — cannot redeem")
-            else:
-                print(f"     ❌ Error: {err[:80]}")
-            print()
+            print(f"  ❌ {info['outcome']}: receipt error: {str(e)[:80]}")
 
     # Final summary
     usdc_after = get_usdc_balance(w3)
@@ -0,0 +1,499 @@
+"""
+╔══════════════════════════════════════════════════════╗
+║   POLYMARKET BTC STRATEGY BOT — REDEEM MANAGER      ║
+╚══════════════════════════════════════════════════════╝
+Automated redemption of winning positions. Used by TradeManager in
+live mode; redeem.py is the manual CLI for the same job.
+"""
+
+import os
+import json
+import time
+import random
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+from web3.providers import HTTPProvider
+from web3.providers.base import JSONBaseProvider
+
+RPC = "https://polygon-bor-rpc.publicnode.com"
+# Read failover pool — the primary stays first so writes are sticky
+FALLBACK_RPCS = [
+    RPC,
+    "https://polygon-rpc.com",
+    "https://polygon.drpc.org",
+]
+CHAIN_ID = 137
+CTF_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"
+USDC_E = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
+# Multicall3 — same address on every chain, including Polygon
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Checksummed once at import — to_checksum_address runs a keccak hash,
+# no reason to repeat it per call or per loop iteration
+USDC_E_CS = Web3.to_checksum_address(USDC_E)
+MULTICALL3_CS = Web3.to_checksum_address(MULTICALL3_ADDRESS)
+# Root collection for redeemPositions; bytes skip the hexstr parse
+PARENT_COLLECTION_ID = b"\x00" * 32
+
+# 4-byte selectors for the batched reads — calldata for these flat
+# signatures is just selector + left-padded 32-byte words, so packing
+# it by hand skips the per-call trip through web3's ABI codec
+_SEL_BALANCE_OF_1155 = Web3.keccak(text="balanceOf(address,uint256)")[:4]
+_SEL_BALANCE_OF_ERC20 = Web3.keccak(text="balanceOf(address)")[:4]
+_SEL_PAYOUT_DENOMINATOR = Web3.keccak(text="payoutDenominator(bytes32)")[:4]
+
+
+def _addr_word(addr: str) -> bytes:
+    return bytes.fromhex(addr[2:]).rjust(32, b"\x00")
+
+CTF_ABI = [
+    {
+        "inputs": [
+            {"internalType": "address", "name": "collateralToken", "type": "address"},
+            {"internalType": "bytes32", "name": "parentCollectionId", "type": "bytes32"},
+            {"internalType": "bytes32", "name": "conditionId", "type": "bytes32"},
+            {"internalType": "uint256[]", "name": "indexSets", "type": "uint256[]"}
+        ],
+        "name": "redeemPositions",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "account", "type": "address"},
+            {"internalType": "uint256", "name": "id", "type": "uint256"}
+        ],
+        "name": "balanceOf",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "bytes32", "name": "conditionId", "type": "bytes32"}
+        ],
+        "name": "payoutDenominator",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+TRADES_CACHE = os.path.join(
+    os.path.expanduser("~"), ".polymarket_bot", "trades.json"
+)
+
+
+def get_trades_cached(client) -> list:
+    """CLOB trade history with an incremental on-disk cache.
+
+    The history is append-only, so re-downloading the full response every
+    run is waste. Cached trades live in ~/.polymarket_bot/trades.json;
+    when the CLOB client supports an `after` filter only the delta past
+    the newest cached timestamp is fetched, otherwise the full response
+    is merged in by trade id. A lock file keeps concurrent runs (bot +
+    manual redeem.py) from clobbering each other's rewrite.
+    """
+    cached: list = []
+    try:
+        with open(TRADES_CACHE) as f:
+            cached = json.load(f)
+    except Exception:
+        cached = []
+
+    def _ts(t):
+        return str(t.get("match_time") or t.get("created_at") or "")
+
+    newest = max((_ts(t) for t in cached), default="")
+
+    fresh = None
+    if newest:
+        try:
+            from py_clob_client.clob_types import TradeParams
+            fresh = client.get_trades(TradeParams(after=newest))
+        except Exception:
+            fresh = None
+    if fresh is None:
+        try:
+            fresh = client.get_trades()
+        except Exception:
+            return cached
+    if not fresh:
+        return cached
+
+    merged = {t.get("id") or (_ts(t), t.get("asset_id")): t for t in cached}
+    changed = False
+    for t in fresh:
+        key = t.get("id") or (_ts(t), t.get("asset_id"))
+        if key not in merged:
+            merged[key] = t
+            changed = True
+    trades = list(merged.values())
+
+    if changed or not cached:
+        lock_path = TRADES_CACHE + ".lock"
+        try:
+            os.makedirs(os.path.dirname(TRADES_CACHE), exist_ok=True)
+            # Best-effort lock: O_EXCL create fails while another run holds it
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            try:
+                tmp = TRADES_CACHE + ".tmp"
+                with open(tmp, "w") as f:
+                    json.dump(trades, f)
+                os.replace(tmp, TRADES_CACHE)
+            finally:
+                os.close(fd)
+                os.unlink(lock_path)
+        except Exception:
+            pass  # another run is writing, or the dir isn't writable
+    return trades
+
+
+def with_backoff(fn, tries: int = 5, base: float = 1.0, cap: float = 32.0):
+    """Call fn(), retrying transient RPC throttles with jittered backoff.
+
+    Public Polygon endpoints rate-limit aggressively; exponential delay
+    plus jitter recovers faster than a fixed sleep and avoids thundering
+    retries. Non-throttle errors propagate immediately.
+    """
+    delay = base
+    for attempt in range(tries):
+        try:
+            return fn()
+        except Exception as e:
+            msg = str(e).lower()
+            throttled = (
+                "429" in msg
+                or "rate limit" in msg
+                or "too many" in msg
+                or "timed out" in msg
+                or "timeout" in msg
+            )
+            if not throttled or attempt == tries - 1:
+                raise
+            time.sleep(min(cap, delay) + random.random() * 0.5)
+            delay *= 2
+
+
+def _pooled_session() -> requests.Session:
+    """Keep-alive session so each RPC costs one round-trip, not a
+    fresh TCP+TLS handshake."""
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0),
+    )
+    return session
+
+
+# Methods that are safe to retry on a different endpoint. Writes
+# (eth_sendRawTransaction) always go to the primary — resubmitting a tx
+# elsewhere on an ambiguous failure risks a duplicate broadcast.
+_FAILOVER_METHODS = {
+    "eth_call",
+    "eth_getBalance",
+    "eth_gasPrice",
+    "eth_getTransactionCount",
+    "eth_getTransactionReceipt",
+    "eth_blockNumber",
+    "eth_chainId",
+}
+
+
+class FallbackHTTPProvider(JSONBaseProvider):
+    """HTTP provider that fails read calls over across several RPCs.
+
+    Public endpoints rate-limit and brown out independently; trying the
+    next one on failure keeps reads working without any caller changes.
+    Sticks with the last endpoint that answered so a healthy fallback
+    isn't abandoned after one request.
+    """
+
+    def __init__(self, rpcs: Optional[list] = None):
+        super().__init__()
+        urls = rpcs or FALLBACK_RPCS
+        self._providers = [
+            HTTPProvider(url, session=_pooled_session()) for url in urls
+        ]
+        self._sticky = 0
+
+    def make_request(self, method, params):
+        if method not in _FAILOVER_METHODS:
+            return self._providers[0].make_request(method, params)
+        n = len(self._providers)
+        last_exc = None
+        for off in range(n):
+            i = (self._sticky + off) % n
+            try:
+                response = self._providers[i].make_request(method, params)
+            except Exception as e:
+                last_exc = e
+                continue
+            self._sticky = i
+            return response
+        raise last_exc
+
+
+def make_w3(rpc: str = RPC) -> Web3:
+    """Web3 over pooled keep-alive sessions with read failover.
+
+    `rpc` stays the primary (and sole write) endpoint; reads fall over
+    to the public backups in FALLBACK_RPCS when it misbehaves.
+    """
+    urls = [rpc] + [u for u in FALLBACK_RPCS if u != rpc]
+    return Web3(FallbackHTTPProvider(urls))
+
+
+ERC20_ABI = [
+    {"constant": True, "inputs": [{"name": "", "type": "address"}],
+     "name": "balanceOf", "outputs": [{"name": "", "type": "uint256"}],
+     "stateMutability": "view", "type": "function"},
+]
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {"name": "requireSuccess", "type": "bool"},
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            },
+        ],
+        "name": "tryAggregate",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            },
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+
+def batch_balance_of(w3, ctf, wallet: str, asset_ids: list) -> dict:
+    """Read CTF balances for all asset_ids in one Multicall3 round-trip.
+
+    One aggregate eth_call replaces N balanceOf round-trips. Falls back
+    to per-asset calls if the batch itself fails (bad RPC, odd asset id).
+    """
+    if not asset_ids:
+        return {}
+    try:
+        multicall = w3.eth.contract(
+            address=MULTICALL3_CS,
+            abi=MULTICALL3_ABI,
+        )
+        wallet_word = _addr_word(wallet)
+        calls = [
+            (ctf.address,
+             _SEL_BALANCE_OF_1155 + wallet_word + int(aid).to_bytes(32, "big"))
+            for aid in asset_ids
+        ]
+        results = with_backoff(multicall.functions.tryAggregate(False, calls).call)
+        return {
+            aid: int.from_bytes(ret, "big") if ok and ret else 0
+            for aid, (ok, ret) in zip(asset_ids, results)
+        }
+    except Exception:
+        balances = {}
+        for aid in asset_ids:
+            try:
+                balances[aid] = ctf.functions.balanceOf(wallet, int(aid)).call()
+            except Exception:
+                balances[aid] = 0
+        return balances
+
+
+def batch_wallet_state(w3, ctf, wallet: str, asset_ids: list) -> tuple:
+    """USDC.e balance plus every CTF balance in one Multicall3 eth_call.
+
+    Returns (usdc_balance, {asset_id: raw_balance}). Falls back to
+    individual calls when the batch fails.
+    """
+    usdc = w3.eth.contract(address=USDC_E_CS, abi=ERC20_ABI)
+    try:
+        multicall = w3.eth.contract(
+            address=MULTICALL3_CS,
+            abi=MULTICALL3_ABI,
+        )
+        wallet_word = _addr_word(wallet)
+        calls = [(usdc.address, _SEL_BALANCE_OF_ERC20 + wallet_word)]
+        calls += [
+            (ctf.address,
+             _SEL_BALANCE_OF_1155 + wallet_word + int(aid).to_bytes(32, "big"))
+            for aid in asset_ids
+        ]
+        results = with_backoff(multicall.functions.tryAggregate(False, calls).call)
+        usdc_ok, usdc_ret = results[0]
+        usdc_bal = (
+            int.from_bytes(usdc_ret, "big") / 1e6 if usdc_ok and usdc_ret else 0.0
+        )
+        balances = {
+            aid: int.from_bytes(ret, "big") if ok and ret else 0
+            for aid, (ok, ret) in zip(asset_ids, results[1:])
+        }
+        return usdc_bal, balances
+    except Exception:
+        try:
+            usdc_bal = usdc.functions.balanceOf(wallet).call() / 1e6
+        except Exception:
+            usdc_bal = 0.0
+        return usdc_bal, batch_balance_of(w3, ctf, wallet, asset_ids)
+
+
+def batch_payout_denominators(w3, ctf, cond_bytes_list: list) -> dict:
+    """payoutDenominator per conditionId in one Multicall3 round-trip.
+
+    Returns {cond_bytes: denominator}; the denominator is 0 until the
+    oracle reports, so callers can skip redemptions that would just
+    revert. Missing/failed reads come back 0 (treated as unresolved).
+    """
+    if not cond_bytes_list:
+        return {}
+    try:
+        multicall = w3.eth.contract(address=MULTICALL3_CS, abi=MULTICALL3_ABI)
+        calls = [
+            (ctf.address, _SEL_PAYOUT_DENOMINATOR + cb)
+            for cb in cond_bytes_list
+        ]
+        results = with_backoff(multicall.functions.tryAggregate(False, calls).call)
+        return {
+            cb: int.from_bytes(ret, "big") if ok and ret else 0
+            for cb, (ok, ret) in zip(cond_bytes_list, results)
+        }
+    except Exception:
+        denoms = {}
+        for cb in cond_bytes_list:
+            try:
+                denoms[cb] = ctf.functions.payoutDenominator(cb).call()
+            except Exception:
+                denoms[cb] = 0
+        return denoms
+
+
+class RedeemManager:
+    """Redeems winning positions for the bot's wallet."""
+
+    def __init__(self, client, private_key: str, wallet_address: str):
+        self.client = client
+        self.private_key = private_key
+        self.wallet = Web3.to_checksum_address(wallet_address)
+        self.w3 = make_w3()
+        self.ctf = self.w3.eth.contract(address=CTF_ADDRESS, abi=CTF_ABI)
+
+    def _get_positions(self) -> dict:
+        """Map asset_id -> conditionId bytes32 from the CLOB history.
+
+        The bytes form is computed once here; the hex string would
+        otherwise be re-parsed inside every redeemPositions build, and
+        malformed ids are dropped up front instead of failing mid-loop.
+        """
+        try:
+            trades = get_trades_cached(self.client)
+        except Exception:
+            return {}
+        positions = {}
+        for t in trades or []:
+            aid = t.get("asset_id") or t.get("collection_id")
+            cond_id = t.get("market")
+            if aid and cond_id and aid not in positions:
+                try:
+                    positions[aid] = bytes.fromhex(
+                        cond_id[2:] if cond_id.startswith("0x") else cond_id
+                    )
+                except ValueError:
+                    continue
+        return positions
+
+    def _redeem_condition(self, cond_bytes: bytes, nonce: int, gas_price: int) -> tuple:
+        """Send one redeemPositions tx.
+
+        Returns (confirmed, sent): `sent` tells the caller whether the
+        nonce was consumed — a build/broadcast failure (typically gas
+        estimation reverting on an unresolved market) must not advance
+        the local nonce or every later tx would sit behind the gap.
+        """
+        try:
+            tx = self.ctf.functions.redeemPositions(
+                USDC_E_CS,
+                PARENT_COLLECTION_ID,
+                cond_bytes,
+                [1, 2],
+            ).build_transaction({
+                "chainId": CHAIN_ID,
+                "from": self.wallet,
+                "nonce": nonce,
+                "gasPrice": gas_price,
+            })
+            signed = self.w3.eth.account.sign_transaction(
+                tx, private_key=self.private_key
+            )
+            tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        except Exception:
+            # Most commonly "execution reverted" — market not resolved yet
+            return (False, False)
+        try:
+            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, 180)
+            return (receipt["status"] == 1, True)
+        except Exception:
+            return (False, True)
+
+    def auto_redeem(self) -> int:
+        """Redeem every position still holding shares.
+
+        Returns the number of successful redemptions.
+        """
+        positions = self._get_positions()
+        if not positions:
+            return 0
+
+        balances = batch_balance_of(
+            self.w3, self.ctf, self.wallet, list(positions)
+        )
+
+        # Holders only, deduplicated by condition — redeemPositions with
+        # indexSets [1, 2] pays out both outcome tokens of a market, so a
+        # second tx for the sibling asset would just revert and burn gas.
+        # Nonce and gas price are fetched once and incremented locally.
+        holding = list(dict.fromkeys(
+            cond_bytes for aid, cond_bytes in positions.items()
+            if balances.get(aid, 0) > 0
+        ))
+        if not holding:
+            return 0
+
+        # Fail fast on unresolved markets: payoutDenominator is 0 until
+        # the oracle reports, and redeemPositions reverts until then —
+        # one batched read instead of N guaranteed-revert broadcasts
+        denoms = batch_payout_denominators(self.w3, self.ctf, holding)
+        holding = [cb for cb in holding if denoms.get(cb, 0) > 0]
+        if not holding:
+            return 0
+        try:
+            nonce = self.w3.eth.get_transaction_count(self.wallet, "pending")
+            gas_price = int(self.w3.eth.gas_price * 1.3)
+        except Exception:
+            return 0
+
+        redeemed = 0
+        for cond_bytes in holding:
+            confirmed, sent = self._redeem_condition(cond_bytes, nonce, gas_price)
+            if confirmed:
+                redeemed += 1
+            if sent:
+                nonce += 1
+        return redeemed
@@ -0,0 +1,207 @@
+"""
+╔══════════════════════════════════════════════════════╗
+║   POLYMARKET SETUP — TOKEN ALLOWANCES               ║
+║   Approve the exchange contracts for this wallet     ║
+╚══════════════════════════════════════════════════════╝
+
+Grants Polymarket's exchange contracts approval to move USDC.e and
+CTF outcome tokens. Run once per wallet before live trading:
+
+  python setup_allowances.py
+"""
+
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Force UTF-8 for Windows terminal
+if sys.platform == "win32":
+    os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+        sys.stderr.reconfigure(encoding="utf-8")
+    except Exception:
+        pass
+
+from web3 import Web3
+from dotenv import load_dotenv
+
+from redeem_manager import (
+    CHAIN_ID, CTF_ADDRESS, USDC_E, MULTICALL3_ADDRESS, MULTICALL3_ABI,
+    _addr_word, make_w3, with_backoff,
+)
+
+load_dotenv()
+
+# 4-byte selectors for the batched pre-check, hand-packed like
+# redeem_manager's batch reads — both calls take two address words, so
+# the calldata needs no trip through the contract codec (whose encode
+# method web3 v7 renamed out from under the old encodeABI spelling)
+_SEL_ALLOWANCE = Web3.keccak(text="allowance(address,address)")[:4]
+_SEL_IS_APPROVED_FOR_ALL = Web3.keccak(text="isApprovedForAll(address,address)")[:4]
+
+PRIVATE_KEY = os.getenv("PRIVATE_KEY")
+WALLET = os.getenv("FUNDER_ADDRESS")
+
+# Polymarket exchange contracts that need spending approval
+EXCHANGES = {
+    "CTF Exchange": "0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E",
+    "Neg Risk Exchange": "0xC5d563A36AE78145C45a50134d48A1215220f80a",
+    "Neg Risk Adapter": "0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296",
+}
+
+MAX_UINT256 = 2 ** 256 - 1
+
+USDC_ABI = [
+    {"inputs": [{"name": "spender", "type": "address"},
+                {"name": "amount", "type": "uint256"}],
+     "name": "approve", "outputs": [{"name": "", "type": "bool"}],
+     "stateMutability": "nonpayable", "type": "function"},
+    {"inputs": [{"name": "owner", "type": "address"},
+                {"name": "spender", "type": "address"}],
+     "name": "allowance", "outputs": [{"name": "", "type": "uint256"}],
+     "stateMutability": "view", "type": "function"},
+]
+
+CTF_APPROVAL_ABI = [
+    {"inputs": [{"name": "operator", "type": "address"},
+                {"name": "approved", "type": "bool"}],
+     "name": "setApprovalForAll", "outputs": [],
+     "stateMutability": "nonpayable", "type": "function"},
+    {"inputs": [{"name": "owner", "type": "address"},
+                {"name": "operator", "type": "address"}],
+     "name": "isApprovedForAll", "outputs": [{"name": "", "type": "bool"}],
+     "stateMutability": "view", "type": "function"},
+]
+
+
+def read_approval_state(w3, usdc, ctf, wallet, exchanges):
+    """Current (allowance, approved) per exchange in one Multicall3 read.
+
+    Six sequential pre-check RPCs become a single eth_call; falls back
+    to individual calls if the batch fails.
+    """
+    try:
+        multicall = w3.eth.contract(
+            address=Web3.to_checksum_address(MULTICALL3_ADDRESS),
+            abi=MULTICALL3_ABI,
+        )
+        wallet_word = _addr_word(wallet)
+        calls = []
+        for exchange in exchanges.values():
+            spender_word = _addr_word(exchange)
+            calls.append((usdc.address,
+                          _SEL_ALLOWANCE + wallet_word + spender_word))
+            calls.append((ctf.address,
+                          _SEL_IS_APPROVED_FOR_ALL + wallet_word + spender_word))
+        results = with_backoff(multicall.functions.tryAggregate(False, calls).call)
+        state = {}
+        for i, name in enumerate(exchanges):
+            a_ok, a_ret = results[2 * i]
+            p_ok, p_ret = results[2 * i + 1]
+            allowance = int.from_bytes(a_ret, "big") if a_ok and a_ret else 0
+            approved = bool(int.from_bytes(p_ret, "big")) if p_ok and p_ret else False
+            state[name] = (allowance, approved)
+        return state
+    except Exception:
+        state = {}
+        for name, exchange in exchanges.items():
+            allowance = usdc.functions.allowance(wallet, exchange).call()
+            approved = ctf.functions.isApprovedForAll(wallet, exchange).call()
+            state[name] = (allowance, approved)
+        return state
+
+
+def main():
+    print("=" * 60)
+    print("  🔓 POLYMARKET ALLOWANCE SETUP")
+    print("=" * 60)
+    print(f"  Wallet: {WALLET}")
+
+    if not PRIVATE_KEY or not WALLET:
+        print("\n  ❌ PRIVATE_KEY / FUNDER_ADDRESS missing — fill in .env first")
+        sys.exit(1)
+
+    w3 = make_w3()
+    wallet = Web3.to_checksum_address(WALLET)
+    usdc = w3.eth.contract(address=Web3.to_checksum_address(USDC_E), abi=USDC_ABI)
+    ctf = w3.eth.contract(address=CTF_ADDRESS, abi=CTF_APPROVAL_ABI)
+
+    # Figure out which of the 3x2 approvals are still missing
+    exchanges = {
+        name: Web3.to_checksum_address(addr)
+        for name, addr in EXCHANGES.items()
+    }
+    state = read_approval_state(w3, usdc, ctf, wallet, exchanges)
+    needed = []
+    for name, exchange in exchanges.items():
+        allowance, approved = state[name]
+        if allowance < MAX_UINT256 // 2:
+            needed.append((f"USDC.e → {name}",
+                           usdc.functions.approve(exchange, MAX_UINT256)))
+        else:
+            print(f"  ✓ USDC.e → {name} already approved")
+        if not approved:
+            needed.append((f"CTF → {name}",
+                           ctf.functions.setApprovalForAll(exchange, True)))
+        else:
+            print(f"  ✓ CTF → {name} already approved")
+
+    if not needed:
+        print("\n  ✅ All allowances already set — nothing to do.")
+        return
+
+    print(f"\n  Sending {len(needed)} approval(s)...")
+
+    # The approvals are independent: one nonce + gas-price fetch, sign
+    # everything up front with locally incremented nonces, broadcast in
+    # parallel, then wait on all receipts — instead of six sequential
+    # send/wait/sleep cycles.
+    base_nonce = w3.eth.get_transaction_count(wallet, "pending")
+    gas_price = int(w3.eth.gas_price * 1.3)
+
+    signed_txs = []
+    for i, (label, fn) in enumerate(needed):
+        tx = fn.build_transaction({
+            "chainId": CHAIN_ID,
+            "from": wallet,
+            "nonce": base_nonce + i,
+            "gasPrice": gas_price,
+        })
+        signed = w3.eth.account.sign_transaction(tx, private_key=PRIVATE_KEY)
+        signed_txs.append((label, signed))
+
+    def broadcast(item):
+        label, signed = item
+        return label, w3.eth.send_raw_transaction(signed.raw_transaction)
+
+    with ThreadPoolExecutor(max_workers=6) as ex:
+        sent = list(ex.map(broadcast, signed_txs))
+
+    for label, tx_hash in sent:
+        print(f"  ⏳ {label} | TX: {tx_hash.hex()[:20]}...")
+
+    def wait(item):
+        label, tx_hash = item
+        return label, w3.eth.wait_for_transaction_receipt(tx_hash, 300)
+
+    print("\n  Waiting for confirmations...")
+    failed = 0
+    with ThreadPoolExecutor(max_workers=6) as ex:
+        for label, receipt in ex.map(wait, sent):
+            if receipt["status"] == 1:
+                print(f"  ✅ {label} confirmed")
+            else:
+                failed += 1
+                print(f"  ❌ {label} reverted")
+
+    print("\n" + "=" * 60)
+    if failed:
+        print(f"  ⚠ {failed} approval(s) failed — re-run this script")
+        sys.exit(1)
+    print("  ✅ Allowances set — the bot can trade live now.")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -23,7 +23,7 @@ from datetime import datetime, timezone
 from typing import Optional, Callable
 from enum import Enum
 
-from candle_feed import Candle, CandleFeed
+from candle_feed import COLOR_GREEN, COLOR_RED, Candle, CandleFeed
 from trade_manager import TradeManager, Trade, TradeDirection, TradeStatus
 from market_finder import MarketFinder, BTCMarket
 from config import (
@@ -45,7 +45,7 @@ class BotState(Enum):
     COOLDOWN = "COOLDOWN"                # 30-min cooldown after 5th candle
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyState:
     """Tracks the current strategy state."""
     bot_state: BotState = BotState.SCANNING
@@ -60,22 +60,34 @@ class StrategyState:
     last_processed_candle_time: float = 0.0             # Avoid reprocessing
     total_signals: int = 0
     skipped_signals: int = 0
+    next_retry_at: float = 0.0                          # Entry-retry backoff gate
+
+    # `now`-taking variants — the tick loop samples the clock once and
+    # threads it through, same pattern as BTCMarket.is_tradeable_at
+    def cooldown_active_at(self, now: float) -> bool:
+        return self.bot_state == BotState.COOLDOWN and now < self.cooldown_until
+
+    def cooldown_remaining_at(self, now: float) -> float:
+        if not self.cooldown_active_at(now):
+            return 0.0
+        return max(0, self.cooldown_until - now)
+
+    def entry_wait_elapsed_at(self, now: float) -> float:
+        if self.entry_wait_start == 0:
+            return 0.0
+        return now - self.entry_wait_start
 
     @property
     def is_cooldown_active(self) -> bool:
-        return self.bot_state == BotState.COOLDOWN and time.time() < self.cooldown_until
+        return self.cooldown_active_at(time.time())
 
     @property
     def cooldown_remaining_sec(self) -> float:
-        if not self.is_cooldown_active:
-            return 0.0
-        return max(0, self.cooldown_until - time.time())
+        return self.cooldown_remaining_at(time.time())
 
     @property
     def entry_wait_elapsed_sec(self) -> float:
-        if self.entry_wait_start == 0:
-            return 0.0
-        return time.time() - self.entry_wait_start
+        return self.entry_wait_elapsed_at(time.time())
 
 
 class StrategyEngine:
@@ -95,25 +107,43 @@ class StrategyEngine:
         self.trader = trade_manager
         self.market = market_finder
         self.state = StrategyState()
+        self._version = 0  # Bumped on state transitions (render debounce)
+        # When no sink is attached, guard the chatty call sites so their
+        # f-strings are never even built
+        self._log_enabled = on_log is not None
         self._log = on_log or (lambda msg: None)
         self._current_market: Optional[BTCMarket] = None
-
-    def process_tick(self):
+        self._tick_now: float = time.time()  # Clock sampled once per tick
+        self._retry_delay: float = 1.0  # Doubles per failed entry, capped
+        # FSM dispatch table — one dict lookup per tick instead of an
+        # if/elif chain over BotState (COOLDOWN is handled before this)
+        self._dispatch = {
+            BotState.SCANNING: self._handle_scanning,
+            BotState.SIGNAL_DETECTED: self._handle_signal,
+            BotState.IN_TRADE: self._handle_in_trade,
+            BotState.PROGRESSIVE: self._handle_in_trade,
+            BotState.WAITING_ENTRY: self._handle_waiting_entry,
+        }
+
+    async def process_tick(self):
         """
         Called every few seconds. Drives the strategy FSM.
         """
+        # One clock read per tick — every FSM step below reuses it
+        self._tick_now = now = time.time()
+
         # 1. Refresh candle data
         try:
-            self.feed.fetch_recent(limit=10)
+            await self.feed.fetch_recent(limit=10)
         except Exception as e:
             self._log(f"⚠ Candle fetch error: {e}")
             return
 
         # 2. Check cooldown
-        if self.state.is_cooldown_active:
+        if self.state.cooldown_active_at(now):
             return  # Still cooling down
 
-        if self.state.bot_state == BotState.COOLDOWN and not self.state.is_cooldown_active:
+        if self.state.bot_state == BotState.COOLDOWN:
             self._log("✅ Cooldown ended — resuming scanning")
             self._reset_state()
 
@@ -126,73 +156,79 @@ class StrategyEngine:
 
         # Avoid reprocessing the same candle
         if latest_closed.close_time <= self.state.last_processed_candle_time:
-            # Still same candle — if waiting for entry, RETRY trade on every tick
+            # Still same candle — if waiting for entry, retry under backoff
+            # (1s → 2s → 4s … capped) instead of hammering the CLOB with
+            # the same price query every tick
             if self.state.bot_state == BotState.WAITING_ENTRY:
                 if self._check_entry_timeout():
                     return  # Timed out, reset already done
-                # Retry the trade — price may have changed
-                self._attempt_trade()
+                if now < self.state.next_retry_at:
+                    return  # Backing off — price query would be identical
+                await self._attempt_trade()
             return
 
         # New candle closed!
         self.state.last_processed_candle_time = latest_closed.close_time
-        self._log(f"🕯 Candle closed: {latest_closed}")
+        if self._log_enabled:
+            self._log(f"🕯 Candle closed: {latest_closed}")
 
         # 4. State machine
-        if self.state.bot_state == BotState.SCANNING:
-            self._handle_scanning(closed)
-
-        elif self.state.bot_state == BotState.SIGNAL_DETECTED:
-            self._handle_signal(closed)
-
-        elif self.state.bot_state == BotState.IN_TRADE:
-            self._handle_trade_result(latest_closed)
+        handler = self._dispatch.get(self.state.bot_state)
+        if handler:
+            await handler(closed)
 
-        elif self.state.bot_state == BotState.PROGRESSIVE:
-            self._handle_trade_result(latest_closed)
-
-        elif self.state.bot_state == BotState.WAITING_ENTRY:
-            # New candle closed while still waiting — retry one more time
-            if not self._check_entry_timeout():
-                self._attempt_trade()
-
-    def _handle_scanning(self, closed: list[Candle]):
+    async def _handle_scanning(self, closed: list[Candle]):
         """Look for 2 consecutive same-color candles."""
         if len(closed) < CONSECUTIVE_CANDLES_SIGNAL:
             return
 
-        last_n = closed[-CONSECUTIVE_CANDLES_SIGNAL:]
-        colors = [c.color for c in last_n]
+        # Index scan over the tail — no slice, no throwaway list, just
+        # int compares against color codes classified at construction
+        n = len(closed)
+        code = closed[-1].color_code
+        for i in range(n - CONSECUTIVE_CANDLES_SIGNAL, n - 1):
+            if closed[i].color_code != code:
+                return
 
-        if all(c == "red" for c in colors):
+        if code == COLOR_RED:
             # 2 red candles → BUY UP (contrarian)
             self._log("🔴🔴 2 RED candles detected → Signal: BUY UP")
-            self.state.signal_direction = TradeDirection.UP
-            self.state.signal_candle_color = "red"
-            self.state.consecutive_count = CONSECUTIVE_CANDLES_SIGNAL
-            self.state.current_candle_number = CONSECUTIVE_CANDLES_SIGNAL
-            self.state.bot_state = BotState.SIGNAL_DETECTED
-            self.state.total_signals += 1
-            self.state.last_signal_time = time.time()
-            self._attempt_trade()
-
-        elif all(c == "green" for c in colors):
+            direction = TradeDirection.UP
+        else:
             # 2 green candles → BUY DOWN (contrarian)
             self._log("🟢🟢 2 GREEN candles detected → Signal: BUY DOWN")
-            self.state.signal_direction = TradeDirection.DOWN
-            self.state.signal_candle_color = "green"
-            self.state.consecutive_count = CONSECUTIVE_CANDLES_SIGNAL
-            self.state.current_candle_number = CONSECUTIVE_CANDLES_SIGNAL
-            self.state.bot_state = BotState.SIGNAL_DETECTED
-            self.state.total_signals += 1
-            self.state.last_signal_time = time.time()
-            self._attempt_trade()
-
-    def _handle_signal(self, closed: list[Candle]):
+            direction = TradeDirection.DOWN
+
+        self.state.signal_direction = direction
+        self.state.signal_candle_color = closed[-1].color
+        self.state.consecutive_count = CONSECUTIVE_CANDLES_SIGNAL
+        self.state.current_candle_number = CONSECUTIVE_CANDLES_SIGNAL
+        self.state.bot_state = BotState.SIGNAL_DETECTED
+        self.state.total_signals += 1
+        self.state.last_signal_time = self._tick_now
+        self._version += 1
+        await self._attempt_trade()
+
+    async def _handle_signal(self, closed: list[Candle]):
         """Signal was detected — waiting for entry or processing."""
-        self._attempt_trade()
+        await self._attempt_trade()
+
+    async def _handle_in_trade(self, closed: list[Candle]):
+        """A candle closed with a trade open — settle it."""
+        await self._handle_trade_result(closed[-1])
+
+    async def _handle_waiting_entry(self, closed: list[Candle]):
+        """New candle closed while still waiting — retry one more time.
+
+        A fresh candle is new information, so the backoff gate resets
+        rather than delaying this retry.
+        """
+        self.state.next_retry_at = 0.0
+        self._retry_delay = 1.0
+        if not self._check_entry_timeout():
+            await self._attempt_trade()
 
-    def _attempt_trade(self):
+    async def _attempt_trade(self):
         """Try to place a trade based on current signal."""
         if self.trader.has_open_trade():
             self._log("⚠ Trade already open — skipping overlap")
@@ -202,12 +238,13 @@ class StrategyEngine:
         if not direction:
             return
 
-        # Find the current Polymarket market
-        self._current_market = self.market.find_current_market()
+        # Find the current Polymarket market — off-loop, so candle fetches
+        # and dashboard updates keep flowing during the HTTP round-trips
+        self._current_market = await self.market.afind_current_market()
 
         if self._current_market:
             # Refresh live prices from CLOB
-            self._current_market = self.market.refresh_market_prices(self._current_market)
+            self._current_market = await self.market.arefresh_market_prices(self._current_market)
 
             # Determine which token to buy
             if direction == TradeDirection.UP:
@@ -219,11 +256,12 @@ class StrategyEngine:
 
             candle_num = self.state.current_candle_number + 1  # Trading the NEXT candle
 
-            self._log(
-                f"📈 Attempting {direction.value} trade "
-                f"(candle #{candle_num}) @ ${current_price:.4f}/share | "
-                f"Market: {self._current_market.question[:50]}"
-            )
+            if self._log_enabled:
+                self._log(
+                    f"📈 Attempting {direction.value} trade "
+                    f"(candle #{candle_num}) @ ${current_price:.4f}/share | "
+                    f"Market: {self._current_market.question[:50]}"
+                )
 
             trade = self.trader.place_trade(
                 direction=direction,
@@ -240,13 +278,20 @@ class StrategyEngine:
                 )
                 self.state.bot_state = BotState.IN_TRADE
                 self.state.entry_wait_start = 0
+                self.state.next_retry_at = 0.0
+                self._retry_delay = 1.0
+                self._version += 1
             else:
                 # Trade failed — show why
-                err = self.trader._last_error or "Price not right"
-                self._log(f"⏳ Trade not placed: {err}")
+                if self._log_enabled:
+                    err = self.trader._last_error or "Price not right"
+                    self._log(f"⏳ Trade not placed: {err}")
                 self.state.bot_state = BotState.WAITING_ENTRY
+                self.state.next_retry_at = self._tick_now + self._retry_delay
+                self._retry_delay = min(self._retry_delay * 2, 30.0)
+                self._version += 1
                 if self.state.entry_wait_start == 0:
-                    self.state.entry_wait_start = time.time()
+                    self.state.entry_wait_start = self._tick_now
                 self._check_entry_timeout()
         else:
             # No market found — use paper simulation
@@ -255,7 +300,7 @@ class StrategyEngine:
 
             trade = self.trader.place_trade(
                 direction=direction,
-                token_id=f"PAPER-{direction.value}-{int(time.time())}",
+                token_id=f"PAPER-{direction.value}-{int(self._tick_now)}",
                 candle_number=candle_num,
                 current_price=SHARE_PRICE,
             )
@@ -266,10 +311,11 @@ class StrategyEngine:
                     f"${trade.amount:.2f} | Candle #{candle_num}"
                 )
                 self.state.bot_state = BotState.IN_TRADE
+                self._version += 1
 
     def _check_entry_timeout(self) -> bool:
         """Check if we've waited too long for the right price. Returns True if timed out."""
-        if self.state.entry_wait_elapsed_sec > MAX_ENTRY_WAIT_MINUTES * 60:
+        if self.state.entry_wait_elapsed_at(self._tick_now) > MAX_ENTRY_WAIT_MINUTES * 60:
             self._log(
                 f"⏰ Entry timeout ({MAX_ENTRY_WAIT_MINUTES}min) — "
                 f"skipping this signal"
@@ -279,7 +325,7 @@ class StrategyEngine:
             return True
         return False
 
-    def _handle_trade_result(self, latest_closed: Candle):
+    async def _handle_trade_result(self, latest_closed: Candle):
         """Check if the current trade won or lost based on candle close."""
         trade = self.trader.current_trade
         if not trade:
@@ -289,21 +335,21 @@ class StrategyEngine:
         # Determine win/loss:
         # If we bought UP token → we WIN if candle closes GREEN (price went up)
         # If we bought DOWN token → we WIN if candle closes RED (price went down)
-        candle_color = latest_closed.color
-        won = False
+        code = latest_closed.color_code
 
         if trade.direction == TradeDirection.UP:
             needed_color = "green"
-            won = (candle_color == "green")
+            won = (code == COLOR_GREEN)
         else:  # DOWN
             needed_color = "red"
-            won = (candle_color == "red")
+            won = (code == COLOR_RED)
 
         self.trader.resolve_trade(trade, won)
 
         # Clear, unambiguous log message
         dir_label = trade.direction.value  # UP or DOWN
-        candle_icon = "🟢" if candle_color == "green" else "🔴"
+        candle_color = latest_closed.color
+        candle_icon = "🟢" if code == COLOR_GREEN else "🔴"
 
         if won:
             self._log(
@@ -320,9 +366,9 @@ class StrategyEngine:
                 f"P&L: ${trade.pnl:.2f} | #{trade.candle_number}"
             )
             # Check progressive entry logic
-            self._handle_progressive_loss(trade)
+            await self._handle_progressive_loss(trade)
 
-    def _handle_progressive_loss(self, trade: Trade):
+    async def _handle_progressive_loss(self, trade: Trade):
         """Handle progressive entries after a loss."""
         candle_num = trade.candle_number
 
@@ -331,17 +377,19 @@ class StrategyEngine:
             self.state.current_candle_number = candle_num
             self.state.bot_state = BotState.PROGRESSIVE
             self.state.progressive_entry = candle_num + 1
+            self._version += 1
 
             self._log(
                 f"📊 Progressive entry → will trade candle "
                 f"#{self.state.progressive_entry}"
             )
             # Immediately attempt next trade
-            self._attempt_trade()
+            await self._attempt_trade()
         else:
             # Reached candle 5 (max) → cooldown
-            self.state.cooldown_until = time.time() + (COOLDOWN_MINUTES * 60)
+            self.state.cooldown_until = self._tick_now + (COOLDOWN_MINUTES * 60)
             self.state.bot_state = BotState.COOLDOWN
+            self._version += 1
             self._log(
                 f"❄️ Max progressive entries reached (candle #{candle_num}) — "
                 f"Cooldown for {COOLDOWN_MINUTES} minutes"
@@ -356,3 +404,6 @@ class StrategyEngine:
         self.state.current_candle_number = 0
         self.state.progressive_entry = 0
         self.state.entry_wait_start = 0.0
+        self.state.next_retry_at = 0.0
+        self._retry_delay = 1.0
+        self._version += 1
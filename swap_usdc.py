@@ -0,0 +1,378 @@
+"""
+╔══════════════════════════════════════════════════════╗
+║   POLYMARKET SETUP — SWAP USDC → USDC.e             ║
+║   Uniswap V3 swap so the wallet can trade            ║
+╚══════════════════════════════════════════════════════╝
+
+Polymarket settles in bridged USDC.e, but exchanges and bridges hand
+out native USDC. This swaps the wallet's native USDC into USDC.e on
+Uniswap V3:
+
+  python swap_usdc.py            # Swap full native USDC balance
+  python swap_usdc.py --amount 5 # Swap $5
+"""
+
+import sys
+import os
+import argparse
+from functools import lru_cache
+
+# Force UTF-8 for Windows terminal
+if sys.platform == "win32":
+    os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+        sys.stderr.reconfigure(encoding="utf-8")
+    except Exception:
+        pass
+
+from web3 import Web3
+from dotenv import load_dotenv
+
+from redeem_manager import (
+    CHAIN_ID, USDC_E, MULTICALL3_CS, MULTICALL3_ABI,
+    _SEL_BALANCE_OF_ERC20, _addr_word, make_w3, with_backoff,
+)
+
+load_dotenv()
+
+PRIVATE_KEY = os.getenv("PRIVATE_KEY")
+WALLET = os.getenv("FUNDER_ADDRESS")
+
+USDC_NATIVE = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
+# Uniswap V3 SwapRouter02 + QuoterV2 on Polygon
+SWAP_ROUTER = "0x68b3465833fb72A70ecDF485E0e4C7bD8665Fc45"
+QUOTER_V2 = "0x61fFE014bA17989E743c5F6cB21bF9697530B21e"
+# USDC/USDC.e pools exist at several tiers; the quoter picks the best
+FEE_TIERS = [100, 500, 3000]
+
+MAX_UINT256 = 2 ** 256 - 1
+# Selectors for the hand-packed batch calldata (redeem_manager keeps
+# balanceOf(address); web3 v7 dropped the encodeABI spelling these
+# batch paths originally leaned on, silently disabling them)
+_SEL_ALLOWANCE = Web3.keccak(text="allowance(address,address)")[:4]
+_SEL_QUOTE_EXACT_INPUT_SINGLE = Web3.keccak(
+    text="quoteExactInputSingle((address,address,uint256,uint24,uint160))"
+)[:4]
+USDC_NATIVE_CS = Web3.to_checksum_address(USDC_NATIVE)
+USDC_E_SWAP_CS = Web3.to_checksum_address(USDC_E)
+# Both tokens are immutable 6-decimal ERC20s — reading decimals()
+# on-chain every run was two wasted round-trips
+USDC_DECIMALS = 6
+USDC_SCALE = 10 ** USDC_DECIMALS
+
+ERC20_ABI = [
+    {"inputs": [{"name": "account", "type": "address"}],
+     "name": "balanceOf", "outputs": [{"name": "", "type": "uint256"}],
+     "stateMutability": "view", "type": "function"},
+    {"inputs": [{"name": "owner", "type": "address"},
+                {"name": "spender", "type": "address"}],
+     "name": "allowance", "outputs": [{"name": "", "type": "uint256"}],
+     "stateMutability": "view", "type": "function"},
+    {"inputs": [{"name": "spender", "type": "address"},
+                {"name": "amount", "type": "uint256"}],
+     "name": "approve", "outputs": [{"name": "", "type": "bool"}],
+     "stateMutability": "nonpayable", "type": "function"},
+]
+
+QUOTER_ABI = [
+    {"inputs": [{"components": [
+        {"name": "tokenIn", "type": "address"},
+        {"name": "tokenOut", "type": "address"},
+        {"name": "amountIn", "type": "uint256"},
+        {"name": "fee", "type": "uint24"},
+        {"name": "sqrtPriceLimitX96", "type": "uint160"},
+    ], "name": "params", "type": "tuple"}],
+     "name": "quoteExactInputSingle",
+     "outputs": [
+        {"name": "amountOut", "type": "uint256"},
+        {"name": "sqrtPriceX96After", "type": "uint160"},
+        {"name": "initializedTicksCrossed", "type": "uint32"},
+        {"name": "gasEstimate", "type": "uint256"},
+     ],
+     "stateMutability": "nonpayable", "type": "function"},
+]
+
+ROUTER_ABI = [
+    {"inputs": [{"components": [
+        {"name": "tokenIn", "type": "address"},
+        {"name": "tokenOut", "type": "address"},
+        {"name": "fee", "type": "uint24"},
+        {"name": "recipient", "type": "address"},
+        {"name": "amountIn", "type": "uint256"},
+        {"name": "amountOutMinimum", "type": "uint256"},
+        {"name": "sqrtPriceLimitX96", "type": "uint160"},
+    ], "name": "params", "type": "tuple"}],
+     "name": "exactInputSingle",
+     "outputs": [{"name": "amountOut", "type": "uint256"}],
+     "stateMutability": "payable", "type": "function"},
+]
+
+
+def _quote_calldata(token_in, token_out, amount_in, fee) -> bytes:
+    """Calldata for a quoteExactInputSingle probe.
+
+    The params struct has only static members, so it ABI-encodes inline
+    as five 32-byte words after the selector — no codec needed.
+    """
+    return (
+        _SEL_QUOTE_EXACT_INPUT_SINGLE
+        + _addr_word(token_in)
+        + _addr_word(token_out)
+        + amount_in.to_bytes(32, "big")
+        + fee.to_bytes(32, "big")
+        + bytes(32)  # sqrtPriceLimitX96 = 0 (no price limit)
+    )
+
+
+@lru_cache(maxsize=1)
+def get_contracts():
+    """(w3, native, bridged, router, quoter), built once per process.
+
+    Contract construction re-parses the ABI and keccaks every function
+    selector; memoizing it keeps that out of main() and gives any
+    future importer (or a retry wrapper around main) the same
+    instances for free.
+    """
+    w3 = make_w3()
+    native = w3.eth.contract(
+        address=USDC_NATIVE_CS, abi=ERC20_ABI
+    )
+    bridged = w3.eth.contract(
+        address=USDC_E_SWAP_CS, abi=ERC20_ABI
+    )
+    router = w3.eth.contract(
+        address=Web3.to_checksum_address(SWAP_ROUTER), abi=ROUTER_ABI
+    )
+    quoter = w3.eth.contract(
+        address=Web3.to_checksum_address(QUOTER_V2), abi=QUOTER_ABI
+    )
+    # Regression guard: these batch paths originally used encodeABI,
+    # which web3 v7 removed — the AttributeError vanished into the
+    # sequential fallbacks and the batching silently never ran. Check
+    # one hand-packed sample against whichever encoder this web3
+    # exposes so encoding drift fails loudly instead of degrading.
+    encode = getattr(quoter, "encode_abi", None) or getattr(quoter, "encodeABI", None)
+    if encode is not None:
+        sample = (USDC_NATIVE_CS, USDC_E_SWAP_CS, USDC_SCALE, 500, 0)
+        expected = Web3.to_bytes(hexstr=encode("quoteExactInputSingle", [sample]))
+        if _quote_calldata(*sample[:4]) != expected:
+            raise RuntimeError(
+                "hand-packed quoter calldata disagrees with the ABI codec — "
+                "batched reads would return garbage"
+            )
+    return w3, native, bridged, router, quoter
+
+
+def read_swap_state(w3, native, bridged, wallet):
+    """All pre-swap reads in one Multicall3 round-trip.
+
+    balanceOf x2 and the router allowance were sequential RPCs;
+    batched they cost one. Falls back to individual calls if the
+    batch fails.
+    """
+    router = Web3.to_checksum_address(SWAP_ROUTER)
+    try:
+        multicall = w3.eth.contract(address=MULTICALL3_CS, abi=MULTICALL3_ABI)
+        wallet_word = _addr_word(wallet)
+        balance_call = _SEL_BALANCE_OF_ERC20 + wallet_word
+        calls = [
+            (native.address, balance_call),
+            (bridged.address, balance_call),
+            (native.address, _SEL_ALLOWANCE + wallet_word + _addr_word(router)),
+        ]
+        results = with_backoff(multicall.functions.tryAggregate(False, calls).call)
+        vals = [int.from_bytes(r, "big") if ok and r else 0 for ok, r in results]
+        return {
+            "native_balance": vals[0],
+            "bridged_balance": vals[1],
+            "allowance": vals[2],
+        }
+    except Exception:
+        return {
+            "native_balance": native.functions.balanceOf(wallet).call(),
+            "bridged_balance": bridged.functions.balanceOf(wallet).call(),
+            "allowance": native.functions.allowance(wallet, router).call(),
+        }
+
+
+def probe_fee_tiers(w3, quoter, amount_in):
+    """Quote every fee tier off-chain, return (best_fee, amount_out).
+
+    The old approach discovered the working tier by signing and
+    broadcasting a tx per tier — each failure burned gas and a receipt
+    wait. QuoterV2 simulates the swap in an eth_call, so all three
+    tiers are probed in one batched round-trip and exactly one tx is
+    ever broadcast. Returns (None, 0) when no pool quotes.
+    """
+    probes = [
+        (USDC_NATIVE_CS, USDC_E_SWAP_CS, amount_in, fee, 0)
+        for fee in FEE_TIERS
+    ]
+    try:
+        multicall = w3.eth.contract(address=MULTICALL3_CS, abi=MULTICALL3_ABI)
+        calls = [
+            (quoter.address, _quote_calldata(*p[:4]))
+            for p in probes
+        ]
+        results = with_backoff(multicall.functions.tryAggregate(False, calls).call)
+        quotes = [
+            int.from_bytes(ret[:32], "big") if ok and ret else 0
+            for ok, ret in results
+        ]
+    except Exception:
+        quotes = []
+        for p in probes:
+            try:
+                quotes.append(
+                    quoter.functions.quoteExactInputSingle(p).call()[0]
+                )
+            except Exception:
+                quotes.append(0)
+    best_fee, best_out = None, 0
+    for fee, out in zip(FEE_TIERS, quotes):
+        if out > best_out:
+            best_fee, best_out = fee, out
+    return best_fee, best_out
+
+
+def fee_fields(w3) -> dict:
+    """EIP-1559 fee fields from one eth_feeHistory call.
+
+    Fetched once and reused for both txs — the legacy per-tx gas_price
+    fetch cost an extra RTT and Polygon prices legacy gasPrice
+    conservatively. Falls back to legacy pricing if the endpoint
+    doesn't serve feeHistory.
+    """
+    try:
+        fh = w3.eth.fee_history(5, "latest", [50])
+        base = fh["baseFeePerGas"][-1]
+        rewards = sorted(r[0] for r in fh["reward"] if r)
+        tip = rewards[len(rewards) // 2] if rewards else w3.to_wei(30, "gwei")
+        return {
+            "maxFeePerGas": 2 * base + tip,
+            "maxPriorityFeePerGas": tip,
+        }
+    except Exception:
+        return {"gasPrice": int(w3.eth.gas_price * 1.3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Swap native USDC to USDC.e")
+    parser.add_argument("--amount", type=float, default=0,
+                        help="USDC amount to swap (default: full balance)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  🔄 USDC → USDC.e SWAP")
+    print("=" * 60)
+    print(f"  Wallet: {WALLET}")
+
+    if not PRIVATE_KEY or not WALLET:
+        print("\n  ❌ PRIVATE_KEY / FUNDER_ADDRESS missing — fill in .env first")
+        sys.exit(1)
+
+    w3, native, bridged, router, quoter = get_contracts()
+    wallet = Web3.to_checksum_address(WALLET)
+    router_addr = router.address
+
+    # No is_connected() probe — that's an extra RPC whose only job is a
+    # friendlier message, and the first real read fails just as clearly
+    try:
+        state = read_swap_state(w3, native, bridged, wallet)
+    except Exception as e:
+        print(f"\n  ❌ Cannot reach the Polygon RPC: {str(e)[:80]}")
+        sys.exit(1)
+    print(f"  Native USDC:  ${state['native_balance'] / USDC_SCALE:.2f}")
+    print(f"  USDC.e:       ${state['bridged_balance'] / USDC_SCALE:.2f}")
+
+    amount_in = (
+        int(args.amount * USDC_SCALE) if args.amount else state["native_balance"]
+    )
+    if amount_in <= 0 or amount_in > state["native_balance"]:
+        print("\n  ❌ Nothing to swap (balance too low)")
+        sys.exit(1)
+
+    # Pick the fee tier off-chain before touching a nonce
+    fee, quoted_out = probe_fee_tiers(w3, quoter, amount_in)
+    if fee is None:
+        print("\n  ❌ No USDC/USDC.e pool quoted — nothing to swap against")
+        sys.exit(1)
+    print(f"  Best route: {fee / 10000:.2%} tier → ~${quoted_out / USDC_SCALE:.2f} out")
+
+    nonce = w3.eth.get_transaction_count(wallet, "pending")
+    fees = fee_fields(w3)
+
+    # Approve and swap are pipelined: both txs are signed with
+    # pre-assigned nonces and broadcast back-to-back, so they land in
+    # consecutive slots and confirm in ~one block instead of the old
+    # wait-for-approve-then-send-swap serial round. When an approve is
+    # in the pipeline the swap can't be gas-estimated yet (allowance
+    # still 0), so it carries an explicit gas limit.
+    min_out = int(quoted_out * 0.995)  # 0.5% below the fresh quote
+    to_send = []
+    swap_overrides = {}
+    try:
+        if state["allowance"] < amount_in:
+            tx = native.functions.approve(
+                router_addr, MAX_UINT256
+            ).build_transaction({
+                "chainId": CHAIN_ID,
+                "from": wallet,
+                "nonce": nonce,
+                **fees,
+            })
+            to_send.append(("Approve", w3.eth.account.sign_transaction(
+                tx, private_key=PRIVATE_KEY
+            )))
+            nonce += 1
+            swap_overrides = {"gas": 250_000}
+
+        params = (
+            native.address, bridged.address, fee,
+            wallet, amount_in, min_out, 0,
+        )
+        tx = router.functions.exactInputSingle(params).build_transaction({
+            "chainId": CHAIN_ID,
+            "from": wallet,
+            "nonce": nonce,
+            **fees,
+            **swap_overrides,
+        })
+        to_send.append(("Swap", w3.eth.account.sign_transaction(
+            tx, private_key=PRIVATE_KEY
+        )))
+    except Exception as e:
+        print(f"\n  ❌ Failed to build txs: {str(e)[:80]}")
+        sys.exit(1)
+
+    print(f"\n  Swapping ${amount_in / USDC_SCALE:.2f} (fee tier {fee / 10000:.2%})...")
+    sent = []
+    try:
+        for label, signed in to_send:
+            tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
+            sent.append((label, tx_hash))
+            print(f"  ⏳ {label} | TX: {tx_hash.hex()[:20]}...")
+    except Exception as e:
+        print(f"  ❌ Broadcast failed: {str(e)[:80]}")
+        sys.exit(1)
+
+    # Both are already in flight — these waits overlap, not stack
+    for label, tx_hash in sent:
+        try:
+            receipt = w3.eth.wait_for_transaction_receipt(tx_hash, 180)
+        except Exception as e:
+            print(f"  ❌ {label}: receipt error: {str(e)[:80]}")
+            sys.exit(1)
+        if receipt["status"] != 1:
+            print(f"  ❌ {label} reverted")
+            sys.exit(1)
+        print(f"  ✅ {label} confirmed")
+
+    new_balance = bridged.functions.balanceOf(wallet).call()
+    print(f"  USDC.e now: ${new_balance / USDC_SCALE:.2f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,27 @@
 Handles trade execution, tracking, P&L, and progressive entries.
 """
 
-import json
 import time
 import os
+import atexit
+import queue
+import threading
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dump_line(obj) -> bytes:
+        return orjson.dumps(obj) + b"\n"
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+    def _json_dump_line(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8") + b"\n"
+from collections import deque
+from itertools import count
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
@@ -15,11 +33,28 @@ from enum import Enum
 
 from config import (
     TRADE_AMOUNT, SHARE_PRICE, MAX_SLIPPAGE,
-    PAPER_MODE, CLOB_HOST, CHAIN_ID,
-    PRIVATE_KEY, FUNDER_ADDRESS, SIGNATURE_TYPE,
+    PAPER_MODE, PRIVATE_KEY, FUNDER_ADDRESS,
 )
 from redeem_manager import RedeemManager
 
+# Bound on the sign+post round-trip — a stalled CLOB must not wedge the
+# strategy loop past the entry window; the retry/backoff path handles it
+ORDER_TIMEOUT_SEC = 5.0
+_order_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="order")
+
+# py_clob_client order types, imported once on first live order instead
+# of re-running the import machinery (lock + sys.modules lookups) per call
+_ORDER_TYPES = None
+
+
+def _get_order_types():
+    global _ORDER_TYPES
+    if _ORDER_TYPES is None:
+        from py_clob_client.clob_types import OrderArgs
+        from py_clob_client.order_builder.constants import BUY
+        _ORDER_TYPES = (OrderArgs, BUY)
+    return _ORDER_TYPES
+
 
 class TradeDirection(Enum):
     UP = "UP"
@@ -35,7 +70,7 @@ class TradeStatus(Enum):
     CANCELLED = "CANCELLED"
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """A single trade record."""
     trade_id: str
@@ -50,10 +85,14 @@ class Trade:
     pnl: float = 0.0       # Realized P&L
     result_price: float = 0.0  # Final share price at resolution
     order_id: str = ""      # Polymarket order ID
+    # Derived from timestamp once — the panel renders this every frame,
+    # and strftime per access dominated the row formatting
+    entry_time: str = field(init=False)
 
-    @property
-    def entry_time(self) -> str:
-        return datetime.fromtimestamp(self.timestamp, tz=timezone.utc).strftime("%H:%M:%S")
+    def __post_init__(self):
+        self.entry_time = datetime.fromtimestamp(
+            self.timestamp, tz=timezone.utc
+        ).strftime("%H:%M:%S")
 
     @property
     def direction_emoji(self) -> str:
@@ -61,15 +100,7 @@ class Trade:
 
     @property
     def status_emoji(self) -> str:
-        status_map = {
-            TradeStatus.PENDING: "⏳",
-            TradeStatus.OPEN: "📊",
-            TradeStatus.WON: "✅",
-            TradeStatus.LOST: "❌",
-            TradeStatus.EXPIRED: "⏰",
-            TradeStatus.CANCELLED: "🚫",
-        }
-        return status_map.get(self.status, "❓")
+        return _STATUS_EMOJI.get(self.status, "❓")
 
     def to_dict(self) -> dict:
         return {
@@ -88,17 +119,57 @@ class Trade:
         }
 
 
+# Built once — membership tests used to allocate a fresh tuple per call
+_RESOLVED_STATUSES = frozenset((TradeStatus.WON, TradeStatus.LOST))
+_OPEN_STATUSES = frozenset((TradeStatus.OPEN, TradeStatus.PENDING))
+
+# Built once — status_emoji used to allocate this dict per access
+_STATUS_EMOJI = {
+    TradeStatus.PENDING: "⏳",
+    TradeStatus.OPEN: "📊",
+    TradeStatus.WON: "✅",
+    TradeStatus.LOST: "❌",
+    TradeStatus.EXPIRED: "⏰",
+    TradeStatus.CANCELLED: "🚫",
+}
+
+
 class TradeManager:
     """Manages trade execution and tracking."""
 
+    __slots__ = (
+        "trades", "current_trade", "_client", "_client_initialized",
+        "_redeem_manager", "_trade_log_file", "_journal_file", "_journal",
+        "_last_error", "_version", "_wins", "_losses", "_pnl_sum",
+        "_volume_sum", "_recent", "_open_by_id", "_id_seq",
+        "_journal_q", "_journal_writer",
+        "_redeem_signal", "_redeem_worker",
+    )
+
     def __init__(self):
         self.trades: list[Trade] = []
         self.current_trade: Optional[Trade] = None
         self._client = None
         self._client_initialized = False
         self._redeem_manager = None
-        self._trade_log_file = "trade_history.json"
+        self._trade_log_file = "trade_history.json"   # Legacy snapshot (migrated)
+        self._journal_file = "trade_history.ndjson"
+        self._journal = None  # Opened lazily by the writer thread
+        self._journal_q = None  # Started lazily on first append
+        self._journal_writer = None
+        self._redeem_signal = None  # Set by winning resolves (live mode)
+        self._redeem_worker = None
         self._last_error = ""
+        self._version = 0  # Bumped on every trade mutation (render debounce)
+        # Running aggregates — stats reads are O(1) instead of rescanning
+        # the whole history per property access
+        self._wins = 0
+        self._losses = 0
+        self._pnl_sum = 0.0
+        self._volume_sum = 0.0
+        self._recent: deque[Trade] = deque(maxlen=10)
+        self._open_by_id: dict[str, Trade] = {}
+        self._id_seq = count()  # Disambiguates ids minted in the same ms
         self._load_history()
 
     def _init_client(self):
@@ -109,18 +180,10 @@ class TradeManager:
             self._client_initialized = True
             return
         try:
-            from py_clob_client.client import ClobClient
-            self._client = ClobClient(
-                CLOB_HOST,
-                key=PRIVATE_KEY,
-                chain_id=CHAIN_ID,
-                signature_type=SIGNATURE_TYPE,
-                funder=FUNDER_ADDRESS,
-            )
-            # Derive or create API credentials for this wallet
+            from polyclient import get_clob_client
+            # Shared bootstrap — builds the client and derives/loads creds
             try:
-                creds = self._client.create_or_derive_api_creds()
-                self._client.set_api_creds(creds)
+                self._client = get_clob_client()
             except Exception as cred_err:
                 err_str = str(cred_err).lower()
                 if "400" in err_str or "not found" in err_str or "invalid" in err_str:
@@ -207,7 +270,12 @@ class TradeManager:
 
         actual_cost = shares * order_price
 
-        trade_id = f"T{int(time.time()*1000)}"
+        # Wall-clock ms plus a per-process sequence number: two trades in
+        # the same millisecond no longer collide (which would merge them
+        # during journal replay). Wall time rather than monotonic_ns so
+        # ids stay unique across restarts too — monotonic resets on boot.
+        now = time.time()  # One clock read — id and timestamp agree
+        trade_id = f"T{int(now * 1000)}-{next(self._id_seq)}"
         order_id = ""
 
         if PAPER_MODE:
@@ -215,8 +283,7 @@ class TradeManager:
             order_id = f"PAPER-{trade_id}"
         else:
             try:
-                from py_clob_client.clob_types import OrderArgs
-                from py_clob_client.order_builder.constants import BUY
+                OrderArgs, BUY = _get_order_types()
 
                 # Use market price + 1 cent for fast fill, capped at max allowed
                 limit_price = round(order_price + 0.01, 2)
@@ -229,8 +296,24 @@ class TradeManager:
                     side=BUY,
                 )
 
-                signed = self._client.create_order(order_args)
-                resp = self._client.post_order(signed)
+                # Run the sign+post on a worker with a hard deadline. On
+                # timeout we treat the entry as failed and let the retry
+                # path take over; the abandoned request may still land,
+                # in which case has_open_trade stays false but the order
+                # id shows up in the CLOB history.
+                def _submit():
+                    signed = self._client.create_order(order_args)
+                    return self._client.post_order(signed)
+
+                try:
+                    resp = _order_executor.submit(_submit).result(
+                        timeout=ORDER_TIMEOUT_SEC
+                    )
+                except FutureTimeout:
+                    self._last_error = (
+                        f"Order timeout (>{ORDER_TIMEOUT_SEC:.0f}s) — CLOB slow"
+                    )
+                    return None
 
                 if isinstance(resp, dict):
                     order_id = resp.get("orderID", resp.get("id", ""))
@@ -260,7 +343,7 @@ class TradeManager:
             amount=actual_cost,
             share_price=target_price,
             shares=shares,
-            timestamp=time.time(),
+            timestamp=now,
             candle_number=candle_number,
             status=TradeStatus.OPEN,
             order_id=order_id,
@@ -268,51 +351,80 @@ class TradeManager:
 
         self.trades.append(trade)
         self.current_trade = trade
-        self._save_history()
+        self._open_by_id[trade.trade_id] = trade
+        self._version += 1
+        self._append_event({"op": "place", "trade": trade.to_dict()})
         return trade
 
     def resolve_trade(self, trade: Trade, won: bool):
         """Resolve a trade as won or lost."""
+        if trade.status in _RESOLVED_STATUSES:
+            return  # Double-resolve would double-count the aggregates
         if won:
             trade.status = TradeStatus.WON
             trade.result_price = 1.0  # Won shares pay $1
             trade.pnl = (trade.result_price * trade.shares) - trade.amount
+            self._wins += 1
         else:
             trade.status = TradeStatus.LOST
             trade.result_price = 0.0  # Lost shares worth $0
             trade.pnl = -trade.amount
+            self._losses += 1
+        self._pnl_sum += trade.pnl
+        self._volume_sum += trade.amount
+        self._recent.append(trade)
 
         if self.current_trade and self.current_trade.trade_id == trade.trade_id:
             self.current_trade = None
 
-        self._save_history()
+        self._open_by_id.pop(trade.trade_id, None)
+        self._version += 1
+        if won and not PAPER_MODE:
+            self._signal_redeem()
+        self._append_event({
+            "op": "resolve",
+            "trade_id": trade.trade_id,
+            "status": trade.status.value,
+            "pnl": trade.pnl,
+            "result_price": trade.result_price,
+        })
 
     def has_open_trade(self) -> bool:
         """Check if there's already an open/pending trade."""
         return self.current_trade is not None and \
-               self.current_trade.status in (TradeStatus.OPEN, TradeStatus.PENDING)
+               self.current_trade.status in _OPEN_STATUSES
 
     def cancel_current_trade(self):
         """Cancel the current trade if it exists."""
         if self.current_trade:
-            self.current_trade.status = TradeStatus.CANCELLED
-            self.current_trade.pnl = 0.0
+            trade = self.current_trade
+            if trade.status in _RESOLVED_STATUSES:
+                # Already resolved — just drop the stale reference, don't
+                # rewrite a WON/LOST record as CANCELLED
+                self.current_trade = None
+                return
+            trade.status = TradeStatus.CANCELLED
+            trade.pnl = 0.0
             self.current_trade = None
-            self._save_history()
+            self._open_by_id.pop(trade.trade_id, None)
+            self._version += 1
+            self._append_event({"op": "cancel", "trade_id": trade.trade_id})
 
     # ── Statistics ──────────────────────────────────
+    # All O(1) reads off the running aggregates; the dashboard polls
+    # several of these back-to-back every render.
 
     @property
     def total_trades(self) -> int:
-        return len([t for t in self.trades if t.status in (TradeStatus.WON, TradeStatus.LOST)])
+        return self._wins + self._losses
 
     @property
     def wins(self) -> int:
-        return len([t for t in self.trades if t.status == TradeStatus.WON])
+        return self._wins
 
     @property
     def losses(self) -> int:
-        return len([t for t in self.trades if t.status == TradeStatus.LOST])
+        return self._losses
 
     @property
     def win_rate(self) -> float:
@@ -322,58 +434,162 @@ class TradeManager:
 
     @property
     def total_pnl(self) -> float:
-        return sum(t.pnl for t in self.trades)
+        return self._pnl_sum
 
     @property
     def total_volume(self) -> float:
-        return sum(t.amount for t in self.trades if t.status in (TradeStatus.WON, TradeStatus.LOST))
+        return self._volume_sum
 
     @property
     def open_trades(self) -> list[Trade]:
-        return [t for t in self.trades if t.status == TradeStatus.OPEN]
+        return list(self._open_by_id.values())
 
     @property
     def recent_trades(self) -> list[Trade]:
         """Last 10 resolved trades."""
-        resolved = [t for t in self.trades if t.status in (TradeStatus.WON, TradeStatus.LOST)]
-        return resolved[-10:]
+        return list(self._recent)
 
     # ── Persistence ─────────────────────────────────
+    # History lives in an append-only NDJSON journal: one event line per
+    # mutation, so a trade costs O(1) bytes written instead of
+    # re-serializing the whole history (which grew with every trade).
+
+    @staticmethod
+    def _trade_from_dict(td: dict) -> Trade:
+        return Trade(
+            trade_id=td["trade_id"],
+            direction=TradeDirection(td["direction"]),
+            token_id=td["token_id"],
+            amount=td["amount"],
+            share_price=td["share_price"],
+            shares=td["shares"],
+            timestamp=td["timestamp"],
+            candle_number=td["candle_number"],
+            status=TradeStatus(td["status"]),
+            pnl=td.get("pnl", 0.0),
+            result_price=td.get("result_price", 0.0),
+            order_id=td.get("order_id", ""),
+        )
 
-    def _save_history(self):
-        """Save trade history to JSON file."""
-        try:
-            data = {
-                "trades": [t.to_dict() for t in self.trades],
-                "last_updated": time.time(),
-            }
-            with open(self._trade_log_file, "w") as f:
-                json.dump(data, f, indent=2)
-        except Exception:
-            pass
+    def _append_event(self, event: dict):
+        """Hand one journal event to the background writer.
+
+        The disk write happens off the trade path — place/resolve only
+        pay for a queue put, not serialization plus file I/O.
+        """
+        if self._journal_q is None:
+            self._journal_q = queue.SimpleQueue()
+            self._journal_writer = threading.Thread(
+                target=self._journal_loop, name="journal", daemon=True
+            )
+            self._journal_writer.start()
+            atexit.register(self._close_journal)
+        self._journal_q.put(event)
+
+    def _journal_loop(self):
+        """Drain queued events to disk until the None sentinel arrives."""
+        while True:
+            event = self._journal_q.get()
+            if event is None:
+                break
+            try:
+                if self._journal is None or self._journal.closed:
+                    self._journal = open(self._journal_file, "ab", buffering=0)
+                self._journal.write(_json_dump_line(event))
+            except Exception:
+                pass
+
+    def _close_journal(self):
+        """Flush pending events and stop the writer (atexit hook)."""
+        q, writer = self._journal_q, self._journal_writer
+        if q is not None:
+            q.put(None)
+            if writer is not None:
+                writer.join(timeout=5)
+        self._journal_q = None
+        self._journal_writer = None
+
+    def _apply_event(self, event: dict, by_id: dict):
+        op = event.get("op")
+        if op == "place":
+            trade = self._trade_from_dict(event["trade"])
+            by_id[trade.trade_id] = trade
+        elif op == "resolve":
+            trade = by_id.get(event.get("trade_id"))
+            if trade:
+                trade.status = TradeStatus(event["status"])
+                trade.pnl = event.get("pnl", 0.0)
+                trade.result_price = event.get("result_price", 0.0)
+        elif op == "cancel":
+            trade = by_id.get(event.get("trade_id"))
+            if trade:
+                trade.status = TradeStatus.CANCELLED
+                trade.pnl = 0.0
 
     def _load_history(self):
-        """Load trade history from JSON file."""
+        """Replay the journal (migrating the legacy JSON snapshot once)."""
+        by_id: dict[str, Trade] = {}
+        events = 0
+        migrated = False
         try:
-            if os.path.exists(self._trade_log_file):
+            if os.path.exists(self._journal_file):
+                with open(self._journal_file, "r") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            self._apply_event(_json_loads(line), by_id)
+                            events += 1
+                        except Exception:
+                            continue  # Torn tail line from a crash
+            elif os.path.exists(self._trade_log_file):
+                # One-time migration from the old full-snapshot format
                 with open(self._trade_log_file, "r") as f:
-                    data = json.load(f)
+                    data = _json_loads(f.read())
                 for td in data.get("trades", []):
-                    trade = Trade(
-                        trade_id=td["trade_id"],
-                        direction=TradeDirection(td["direction"]),
-                        token_id=td["token_id"],
-                        amount=td["amount"],
-                        share_price=td["share_price"],
-                        shares=td["shares"],
-                        timestamp=td["timestamp"],
-                        candle_number=td["candle_number"],
-                        status=TradeStatus(td["status"]),
-                        pnl=td.get("pnl", 0.0),
-                        result_price=td.get("result_price", 0.0),
-                        order_id=td.get("order_id", ""),
-                    )
-                    self.trades.append(trade)
+                    trade = self._trade_from_dict(td)
+                    by_id[trade.trade_id] = trade
+                migrated = True
+        except Exception:
+            pass
+        self.trades = list(by_id.values())
+        # Seed the running aggregates in the same startup pass
+        for t in self.trades:
+            if t.status == TradeStatus.WON:
+                self._wins += 1
+            elif t.status == TradeStatus.LOST:
+                self._losses += 1
+            else:
+                if t.status == TradeStatus.OPEN:
+                    self._open_by_id[t.trade_id] = t
+                continue
+            self._pnl_sum += t.pnl
+            self._volume_sum += t.amount
+            self._recent.append(t)
+        # Compact when update events have bloated the journal well past
+        # one line per trade, or to seed it from a migrated snapshot
+        if migrated or (events > 100 and events > 2 * len(self.trades)):
+            self._compact_journal()
+
+    def _compact_journal(self):
+        """Rewrite the journal as one place event per trade.
+
+        Written to a sidecar file and swapped in with os.replace so a
+        crash mid-compaction leaves the old journal intact instead of a
+        truncated one.
+        """
+        try:
+            if self._journal is not None and not self._journal.closed:
+                self._journal.close()
+                self._journal = None
+            tmp = self._journal_file + ".tmp"
+            with open(tmp, "wb") as f:
+                for t in self.trades:
+                    f.write(_json_dump_line({"op": "place", "trade": t.to_dict()}))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self._journal_file)
         except Exception:
             pass
 
@@ -381,11 +597,37 @@ class TradeManager:
         """Returns a string summarizing the P&L."""
         return f"Total P&L: {'📈' if self.total_pnl >= 0 else '📉'} ${self.total_pnl:+.2f}"
 
+    def _signal_redeem(self):
+        """Wake the redemption worker after a winning resolve.
+
+        Redemption used to wait for the periodic redeem_winnings sweep;
+        now each live win nudges a daemon worker that debounces for a
+        couple of seconds (coalescing bursts of resolves) and runs
+        auto_redeem off the strategy thread.
+        """
+        if self._redeem_signal is None:
+            self._redeem_signal = threading.Event()
+            self._redeem_worker = threading.Thread(
+                target=self._redeem_loop, name="redeem", daemon=True
+            )
+            self._redeem_worker.start()
+        self._redeem_signal.set()
+
+    def _redeem_loop(self):
+        while True:
+            self._redeem_signal.wait()
+            time.sleep(2.0)  # Debounce — one sweep per burst of wins
+            self._redeem_signal.clear()
+            try:
+                self.redeem_winnings()
+            except Exception:
+                pass  # Next win (or the periodic sweep) retries
+
     def redeem_winnings(self) -> int:
         """Automated redemption of winning positions in live mode."""
         if PAPER_MODE:
             return 0
-        
+
         self._init_client()
         if self._redeem_manager:
             return self._redeem_manager.auto_redeem()